@@ -1,10 +1,50 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
 from .models import BackupArtifact, BackupJob, RestoreJob, Schedule
 
+ESTIMATED_COUNT_THRESHOLD = 10_000
+
+
+class FasterAdminPaginator(Paginator):
+    """Use the planner's row estimate instead of COUNT(*) for unfiltered PostgreSQL changelists."""
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, "query", None)
+        if query is None or query.where or connections[queryset.db].vendor != "postgresql":
+            return super().count
+
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        estimate = row[0] if row else -1
+        if estimate < ESTIMATED_COUNT_THRESHOLD:
+            return super().count
+        return estimate
+
+
+class ChangeListAdmin(admin.ModelAdmin):
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    list_only_fields: tuple[str, ...] = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = getattr(request, "resolver_match", None)
+        if self.list_only_fields and match and (match.url_name or "").endswith("_changelist"):
+            queryset = queryset.only(*self.list_only_fields)
+        return queryset
+
 
 @admin.register(BackupJob)
-class BackupJobAdmin(admin.ModelAdmin):
+class BackupJobAdmin(ChangeListAdmin):
     list_display = (
         "id",
         "name",
@@ -16,10 +56,11 @@ class BackupJobAdmin(admin.ModelAdmin):
     )
     list_filter = ("db_type", "backup_type", "storage_type", "status")
     search_fields = ("name",)
+    list_only_fields = list_display
 
 
 @admin.register(BackupArtifact)
-class BackupArtifactAdmin(admin.ModelAdmin):
+class BackupArtifactAdmin(ChangeListAdmin):
     list_display = (
         "id",
         "backup_job",
@@ -32,16 +73,37 @@ class BackupArtifactAdmin(admin.ModelAdmin):
     )
     list_filter = ("storage_type", "is_compressed", "is_encrypted")
     search_fields = ("file_name", "file_path")
+    list_select_related = ("backup_job",)
+    list_only_fields = (
+        "id",
+        "backup_job__name",
+        "backup_job__db_type",
+        "file_name",
+        "storage_type",
+        "size_bytes",
+        "is_compressed",
+        "is_encrypted",
+        "created_at",
+    )
 
 
 @admin.register(RestoreJob)
-class RestoreJobAdmin(admin.ModelAdmin):
+class RestoreJobAdmin(ChangeListAdmin):
     list_display = ("id", "backup_job", "backup_artifact", "status", "created_at")
     list_filter = ("status",)
+    list_select_related = ("backup_job", "backup_artifact")
+    list_only_fields = (
+        "id",
+        "backup_job__name",
+        "backup_job__db_type",
+        "backup_artifact__file_name",
+        "status",
+        "created_at",
+    )
 
 
 @admin.register(Schedule)
-class ScheduleAdmin(admin.ModelAdmin):
+class ScheduleAdmin(ChangeListAdmin):
     list_display = (
         "id",
         "backup_job",
@@ -53,3 +115,15 @@ class ScheduleAdmin(admin.ModelAdmin):
         "lease_expires_at",
     )
     list_filter = ("is_active",)
+    list_select_related = ("backup_job",)
+    list_only_fields = (
+        "id",
+        "backup_job__name",
+        "backup_job__db_type",
+        "cron_expression",
+        "is_active",
+        "retry_count",
+        "max_retries",
+        "next_run_at",
+        "lease_expires_at",
+    )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BackupCoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "backup_core"
+
+    def ready(self):
+        from . import counters  # noqa: F401  (connects the counter signal handlers)
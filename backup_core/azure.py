@@ -1,6 +1,49 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
+from typing import BinaryIO
+
+from django.conf import settings
+
+DEFAULT_AZURE_CONCURRENCY = 8
+AZURE_MAX_BLOCK_SIZE = 16 * 1024 * 1024
+AZURE_MAX_SINGLE_PUT_SIZE = 64 * 1024 * 1024
+AZURE_POOL_MAXSIZE = 32
+
+
+@functools.lru_cache(maxsize=4)
+def _service_client(connection_string: str):
+    try:
+        from azure.storage.blob import BlobServiceClient
+    except ImportError as exc:
+        raise RuntimeError(
+            "Azure upload requires azure-storage-blob. Install it with: pip install azure-storage-blob"
+        ) from exc
+
+    return BlobServiceClient.from_connection_string(
+        connection_string,
+        max_block_size=AZURE_MAX_BLOCK_SIZE,
+        max_single_put_size=AZURE_MAX_SINGLE_PUT_SIZE,
+        transport=_transport(),
+    )
+
+
+def _transport():
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+
+    # One keep-alive pool per client, large enough for every parallel block upload.
+    pool_size = max(AZURE_POOL_MAXSIZE, _concurrency())
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(session=session, session_owner=False)
+
+
+def _concurrency() -> int:
+    return max(int(getattr(settings, "BACKUP_AZURE_CONCURRENCY", DEFAULT_AZURE_CONCURRENCY)), 1)
 
 
 class AzureBlobStorageBackend:
@@ -10,28 +53,32 @@ class AzureBlobStorageBackend:
         self.connection_string = connection_string
 
     def store_file(self, source_path: str, filename: str | None = None) -> str:
-        try:
-            from azure.storage.blob import BlobServiceClient
-        except ImportError as exc:
-            raise RuntimeError(
-                "Azure upload requires azure-storage-blob. Install it with: pip install azure-storage-blob"
-            ) from exc
-
         source = Path(source_path)
         if not source.exists():
             raise FileNotFoundError(f"Backup file does not exist: {source}")
 
-        blob_name = filename or source.name
+        with source.open("rb") as data:
+            return self.store_stream(data, filename or source.name, length=source.stat().st_size)
+
+    def store_stream(self, stream: BinaryIO, filename: str, length: int | None = None) -> str:
+        blob_name = filename
         if self.prefix:
             blob_name = f"{self.prefix}/{blob_name}"
 
-        if not self.connection_string:
-            raise RuntimeError("Azure connection string is required for Azure blob uploads.")
+        container_client = self._container_client()
+        # Blocks are staged in parallel and committed once the stream is drained.
+        container_client.upload_blob(
+            name=blob_name,
+            data=stream,
+            length=length,
+            overwrite=True,
+            max_concurrency=_concurrency(),
+        )
 
-        service = BlobServiceClient.from_connection_string(self.connection_string)
-        container_client = service.get_container_client(self.container)
+        return f"azure://{self.container}/{blob_name}"
 
-        with source.open("rb") as data:
-            container_client.upload_blob(name=blob_name, data=data, overwrite=True)
+    def _container_client(self):
+        if not self.connection_string:
+            raise RuntimeError("Azure connection string is required for Azure blob uploads.")
 
-        return f"azure://{self.container}/{blob_name}"
+        return _service_client(self.connection_string).get_container_client(self.container)
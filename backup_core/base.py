@@ -1,7 +1,26 @@
 from __future__ import annotations
 
+import functools
+import os
+import shutil
+import subprocess
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Iterable
+from collections import deque
+from typing import BinaryIO, Iterable
+from urllib.parse import unquote, urlparse
+
+from .pipeline import ChunkReader
+
+STREAM_PIPE_CHUNK_SIZE = 1024 * 1024
+STDERR_TAIL_LINES = 512
+STDERR_DETAIL_CHARS = 4000
+COMMAND_PIPE_BUFSIZE = 1 << 16
+CONNECTION_CHECK_TTL_SECONDS = 60
+
+# (db_type, connection params) -> monotonic time of the last successful test_connection().
+_verified_connections: dict[tuple, float] = {}
 
 
 class AdapterError(Exception):
@@ -15,9 +34,13 @@ class DatabaseAdapter(ABC):
     fallback_incremental_to_full = True
     fallback_differential_to_full = True
     supports_selective_restore = False
+    supports_parallel_table_restore = False
+    connection_check_ttl = CONNECTION_CHECK_TTL_SECONDS
 
     def __init__(self, connection_params: dict | None = None) -> None:
         self.connection_params = connection_params or {}
+        # Set by the backup command when the dump is compressed after the adapter hands it over.
+        self.compressed_downstream = False
 
     @abstractmethod
     def test_connection(self) -> None:
@@ -36,6 +59,43 @@ class DatabaseAdapter(ABC):
     def restore(self, backup_file: str, tables: Iterable[str] | None = None) -> None:
         """Restore database from backup file."""
 
+    def ensure_connection(self) -> None:
+        """``test_connection`` unless the same target passed one within ``connection_check_ttl`` seconds."""
+        key = (self.db_type, tuple(sorted((name, repr(value)) for name, value in self.connection_params.items())))
+        checked_at = _verified_connections.get(key)
+        if checked_at is not None and time.monotonic() - checked_at < self.connection_check_ttl:
+            return
+        self.test_connection()
+        _verified_connections[key] = time.monotonic()
+
+    def restore_table(self, backup_file: str, table: str) -> None:
+        """Restore a single table/collection; used for parallel selective restores."""
+        self.restore(backup_file, tables=[table])
+
+    def supports_parallel_full_restore(self, backup_name: str) -> bool:
+        """Whether ``restore_parallel`` can spread a full restore of this backup over several connections."""
+        return False
+
+    def restore_parallel(self, backup_file: str, jobs: int) -> None:
+        """Restore a full backup using up to ``jobs`` concurrent database connections."""
+        self.restore(backup_file)
+
+    def supports_stream_backup(self, backup_type: str = "full", tables: Iterable[str] | None = None) -> bool:
+        """Whether ``backup_stream`` can produce this backup without writing a local file first."""
+        return False
+
+    def backup_stream(self, backup_type: str = "full", tables: Iterable[str] | None = None) -> BinaryIO:
+        """Readable stream of a fresh backup; a failing dump tool raises AdapterError from ``read``."""
+        raise AdapterError(f"{self.db_type} adapter cannot back up to a stream.")
+
+    def supports_stream_restore(self, backup_name: str, tables: Iterable[str] | None = None) -> bool:
+        """Whether ``restore_stream`` can restore this backup without a file on disk."""
+        return False
+
+    def restore_stream(self, stream: BinaryIO, backup_name: str, tables: Iterable[str] | None = None) -> None:
+        """Restore database from a readable stream of the (decrypted, decompressed) backup."""
+        raise AdapterError(f"{self.db_type} adapter cannot restore from a stream.")
+
     def validate_backup_type(self, backup_type: str) -> None:
         allowed = {"full", "incremental", "differential"}
         if backup_type not in allowed:
@@ -56,6 +116,176 @@ class DatabaseAdapter(ABC):
         return backup_type
 
 
+def _fast_unquote(value: str) -> str:
+    # Most URIs carry no percent-escapes, so skip unquote's per-character scan for them.
+    return unquote(value) if "%" in value else value
+
+
+@functools.lru_cache(maxsize=256)
+def parse_connection_uri(uri: str, schemes: frozenset[str]) -> tuple[tuple[str, object], ...] | None:
+    """(param, value) pairs a connection URI provides, or None when its scheme is not in ``schemes``."""
+    parsed = urlparse(uri)
+    if parsed.scheme not in schemes:
+        return None
+
+    values: list[tuple[str, object]] = []
+    if parsed.username:
+        values.append(("username", _fast_unquote(parsed.username)))
+    if parsed.password:
+        values.append(("password", _fast_unquote(parsed.password)))
+    if parsed.hostname:
+        values.append(("host", parsed.hostname))
+    if parsed.port:
+        values.append(("port", parsed.port))
+    if parsed.path and parsed.path != "/":
+        values.append(("database", _fast_unquote(parsed.path.lstrip("/"))))
+    return tuple(values)
+
+
+def _drain_stderr(pipe) -> tuple[threading.Thread, deque]:
+    """Keep only the last ``STDERR_TAIL_LINES`` lines of ``pipe``, read continuously so it never fills."""
+    tail: deque = deque(maxlen=STDERR_TAIL_LINES)
+
+    def drain() -> None:
+        with pipe:
+            tail.extend(pipe)
+
+    thread = threading.Thread(target=drain, name="command-stderr", daemon=True)
+    thread.start()
+    return thread, tail
+
+
+def _tail_text(tail: deque) -> str:
+    return b"".join(tail).decode("utf-8", errors="replace")[-STDERR_DETAIL_CHARS:]
+
+
+def run_command(
+    command: list[str],
+    env: dict[str, str] | None = None,
+    stdin: BinaryIO | None = None,
+    stdout: BinaryIO | None = None,
+) -> subprocess.CompletedProcess:
+    """Run ``command`` with stdout sent to ``stdout`` or discarded; ``stderr`` of the result is a bounded tail."""
+    process = subprocess.Popen(
+        command,
+        stdin=stdin if stdin is not None else subprocess.DEVNULL,
+        stdout=stdout if stdout is not None else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        bufsize=COMMAND_PIPE_BUFSIZE,
+        env=env,
+    )
+    thread, tail = _drain_stderr(process.stderr)
+    returncode = process.wait()
+    thread.join()
+    return subprocess.CompletedProcess(command, returncode, "", _tail_text(tail))
+
+
+def run_with_stream(
+    command: list[str],
+    stream: BinaryIO,
+    env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess:
+    """Run ``command`` with ``stream`` piped to its stdin by a background thread."""
+    read_fd, write_fd = os.pipe()
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=read_fd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=COMMAND_PIPE_BUFSIZE,
+            env=env,
+        )
+    except BaseException:
+        os.close(write_fd)
+        raise
+    finally:
+        os.close(read_fd)
+
+    errors: list[BaseException] = []
+
+    def pump() -> None:
+        try:
+            with os.fdopen(write_fd, "wb") as pipe:
+                try:
+                    shutil.copyfileobj(stream, pipe, STREAM_PIPE_CHUNK_SIZE)
+                except BrokenPipeError:
+                    raise
+                except BaseException as exc:
+                    # Kill before the pipe closes so the tool never treats a broken stream as complete.
+                    process.kill()
+                    errors.append(exc)
+        except BrokenPipeError:
+            pass  # The tool exited early; its exit status explains why.
+
+    pump_thread = threading.Thread(target=pump, name="restore-stream", daemon=True)
+    pump_thread.start()
+    stderr_thread, tail = _drain_stderr(process.stderr)
+    returncode = process.wait()
+    pump_thread.join()
+    stderr_thread.join()
+
+    if errors:
+        raise errors[0]
+    return subprocess.CompletedProcess(command, returncode, "", _tail_text(tail))
+
+
+class CommandOutputStream(ChunkReader):
+    """stdout of a running dump tool, read in chunks; a non-zero exit raises at end of stream."""
+
+    def __init__(
+        self,
+        command: list[str],
+        action: str,
+        env: dict[str, str] | None = None,
+        chunk_size: int = STREAM_PIPE_CHUNK_SIZE,
+    ) -> None:
+        super().__init__()
+        self._action = action
+        self._chunk_size = chunk_size
+        try:
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env=env,
+            )
+        except OSError as exc:
+            raise AdapterError(f"{action} failed: {exc}") from exc
+        # Drain stderr alongside stdout so a chatty tool never blocks on a full pipe.
+        self._stderr_thread, self._stderr_tail = _drain_stderr(self._process.stderr)
+        self._finished = False
+
+    def _next_chunk(self) -> bytes | None:
+        if self._finished:
+            return None
+        chunk = self._process.stdout.read(self._chunk_size)
+        if chunk:
+            return chunk
+        self._finished = True
+        returncode = self._process.wait()
+        self._stderr_thread.join()
+        if returncode != 0:
+            details = _tail_text(self._stderr_tail).strip() or "Unknown command failure."
+            raise AdapterError(f"{self._action} failed: {details}")
+        return None
+
+    def close(self) -> None:
+        if not self.closed:
+            if self._process.poll() is None:
+                # Closed before the end of the dump: stop the tool instead of leaving it blocked on the pipe.
+                self._process.kill()
+            self._process.stdout.close()
+            self._process.wait()
+            self._stderr_thread.join()
+        super().close()
+
+
+def clear_connection_checks() -> None:
+    _verified_connections.clear()
+
+
 def get_adapter(db_type: str, connection_params: dict | None = None) -> DatabaseAdapter:
     db_type = (db_type or "").lower().strip()
 
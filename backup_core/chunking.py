@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from .cpu import effective_cpu_count
+
+MIN_CHUNK_SIZE = 64 * 1024
+SMALL_FILE_CHUNK_SIZE = 4 << 20
+MEDIUM_FILE_CHUNK_SIZE = 16 << 20
+LARGE_FILE_CHUNK_SIZE = 32 << 20
+
+_MEDIUM_FILE_BYTES = 1 << 30
+_LARGE_FILE_BYTES = 16 << 30
+
+
+def pick_chunk_size(file_size: int | None, cpu_count: int | None = None) -> int:
+    """Chunk size for reading, compressing and uploading a file of ``file_size`` bytes (None: unknown)."""
+    if file_size is None:
+        return SMALL_FILE_CHUNK_SIZE
+    if file_size < _MEDIUM_FILE_BYTES:
+        chunk_size = SMALL_FILE_CHUNK_SIZE
+    elif file_size < _LARGE_FILE_BYTES:
+        chunk_size = MEDIUM_FILE_CHUNK_SIZE
+    else:
+        chunk_size = LARGE_FILE_CHUNK_SIZE
+
+    # Leave at least two chunks per core so parallel consumers are not starved.
+    cpus = cpu_count or effective_cpu_count()
+    chunk_size = min(chunk_size, file_size // (cpus * 2))
+    return max(chunk_size, MIN_CHUNK_SIZE)
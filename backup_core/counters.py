@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from django.db.models import Count, F, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import BackupCounters, BackupJob, RestoreJob
+
+# Counter field per status for each counted model; "total" counts every row.
+COUNTED_FIELDS = {
+    BackupJob: {
+        "total": "jobs_total",
+        BackupJob.STATUS_SUCCESS: "jobs_success",
+        BackupJob.STATUS_FAILED: "jobs_failed",
+    },
+    RestoreJob: {
+        "total": "restores_total",
+        RestoreJob.STATUS_FAILED: "restores_failed",
+    },
+}
+
+_UNKNOWN = object()
+
+
+def apply_deltas(deltas: dict[str, int]) -> None:
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    # One UPDATE with F() increments; concurrent writers cannot lose each other's counts.
+    updates = {field: F(field) + delta for field, delta in deltas.items()}
+    counters = BackupCounters.objects.filter(id=BackupCounters.SINGLETON_ID)
+    if not counters.update(updated_at=timezone.now(), **updates):
+        BackupCounters.objects.get_or_create(id=BackupCounters.SINGLETON_ID)
+        counters.update(updated_at=timezone.now(), **updates)
+
+
+def read_counters() -> BackupCounters:
+    counters = BackupCounters.objects.filter(id=BackupCounters.SINGLETON_ID).first()
+    return counters or reconcile_counters()
+
+
+def reconcile_counters() -> BackupCounters:
+    """Recount from the history tables and store the exact totals."""
+    jobs = BackupJob.objects.aggregate(
+        total=Count("id"),
+        success=Count("id", filter=Q(status=BackupJob.STATUS_SUCCESS)),
+        failed=Count("id", filter=Q(status=BackupJob.STATUS_FAILED)),
+    )
+    restores = RestoreJob.objects.aggregate(
+        total=Count("id"),
+        failed=Count("id", filter=Q(status=RestoreJob.STATUS_FAILED)),
+    )
+    counters, _ = BackupCounters.objects.update_or_create(
+        id=BackupCounters.SINGLETON_ID,
+        defaults={
+            "jobs_total": jobs["total"],
+            "jobs_success": jobs["success"],
+            "jobs_failed": jobs["failed"],
+            "restores_total": restores["total"],
+            "restores_failed": restores["failed"],
+        },
+    )
+    return counters
+
+
+def _status_deltas(fields: dict, old_status, new_status) -> dict[str, int]:
+    deltas: dict[str, int] = {}
+    if old_status in fields:
+        deltas[fields[old_status]] = deltas.get(fields[old_status], 0) - 1
+    if new_status in fields:
+        deltas[fields[new_status]] = deltas.get(fields[new_status], 0) + 1
+    return deltas
+
+
+@receiver(post_save, sender=BackupJob)
+@receiver(post_save, sender=RestoreJob)
+def _count_saved(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    fields = COUNTED_FIELDS[sender]
+    if created:
+        deltas = _status_deltas(fields, None, instance.status)
+        deltas[fields["total"]] = 1
+    else:
+        if update_fields is not None and "status" not in update_fields:
+            return
+        old_status = getattr(instance, "_counted_status", _UNKNOWN)
+        if old_status is _UNKNOWN or old_status == instance.status:
+            return
+        deltas = _status_deltas(fields, old_status, instance.status)
+    apply_deltas(deltas)
+    instance._counted_status = instance.status
+
+
+@receiver(post_delete, sender=BackupJob)
+@receiver(post_delete, sender=RestoreJob)
+def _count_deleted(sender, instance, **kwargs):
+    fields = COUNTED_FIELDS[sender]
+    # The row is gone, so never fall back to loading a deferred status.
+    deltas = _status_deltas(fields, getattr(instance, "_counted_status", instance.__dict__.get("status")), None)
+    deltas[fields["total"]] = deltas.get(fields["total"], 0) - 1
+    apply_deltas(deltas)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import functools
+import os
+
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+@functools.lru_cache(maxsize=1)
+def effective_cpu_count() -> int:
+    """CPUs this process may actually use: affinity mask and container CPU quota, not the host total."""
+    try:
+        count = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        count = os.cpu_count() or 1
+
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        count = min(count, quota)
+    return max(count, 1)
+
+
+def _cgroup_cpu_quota() -> int | None:
+    try:
+        with open(CGROUP_V2_CPU_MAX) as handle:
+            quota, period = handle.read().split()[:2]
+    except (OSError, ValueError):
+        try:
+            with open(CGROUP_V1_QUOTA) as quota_file, open(CGROUP_V1_PERIOD) as period_file:
+                quota, period = quota_file.read().strip(), period_file.read().strip()
+        except OSError:
+            return None
+    if quota in ("max", "-1"):
+        return None
+    try:
+        # A fractional quota (e.g. 1.5 CPUs) rounds down, but never below one.
+        return max(int(quota) // int(period), 1)
+    except (ValueError, ZeroDivisionError):
+        return None
@@ -1,24 +1,324 @@
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
+import hmac
+import os
+import shutil
+import struct
 from pathlib import Path
+from typing import BinaryIO
 
+from .pipeline import ChainedReader, ChunkReader
 
-def _get_fernet():
+# Backup file layout: magic (5) | file salt (16) | nonce prefix (4) | frames. Each frame is
+# length (4, top bit marks the final frame) | tag (16) | AES-256-GCM ciphertext,
+# sealed with nonce = prefix | frame index (8) so frames cannot be reordered or dropped.
+# The random salt gives every file its own key, so nonces never repeat under one key.
+_MAGIC = b"BKEv3"
+_FILE_SALT_SIZE = 16
+_NONCE_PREFIX_SIZE = 4
+_FRAME_SIZE = 4 * 1024 * 1024
+_FRAME_HEADER = struct.Struct(">I")
+_FINAL_FRAME_FLAG = 0x80000000
+_GCM_NONCE_SIZE = 12
+_GCM_TAG_SIZE = 16
+_SCRYPT_SALT = b"backup_v1"
+_FILE_KEY_INFO = b"backup file key"
+
+# Framed layout written before per-file keys: magic (5) | nonce prefix (4) | frames, all
+# sealed with the scrypt key itself.
+_MAGIC_V2 = b"BKEv2"
+
+# Single-stream AES-GCM layout written before framing: magic (5) | nonce (12) | ciphertext | tag (16).
+_MAGIC_V1 = b"BKEv1"
+
+# Legacy Fernet token layout: version (1) | timestamp (8) | IV (16) | ciphertext | HMAC-SHA256 (32).
+_FERNET_VERSION = b"\x80"
+_FERNET_HEADER_SIZE = 25
+_FERNET_HMAC_SIZE = 32
+
+
+def _get_aesgcm():
     try:
-        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     except ImportError as exc:
         raise RuntimeError(
             "Encryption requested but 'cryptography' is not installed. "
             "Install it with: pip install cryptography"
         ) from exc
-    return Fernet
+    return AESGCM
 
 
-def _derive_fernet_key(secret: str) -> bytes:
+def _get_cipher_modules():
+    try:
+        from cryptography.fernet import InvalidToken
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    except ImportError as exc:
+        raise RuntimeError(
+            "Encryption requested but 'cryptography' is not installed. "
+            "Install it with: pip install cryptography"
+        ) from exc
+    return Cipher, algorithms, modes, padding, InvalidToken
+
+
+@functools.lru_cache(maxsize=32)
+def _derive_key(secret: str) -> bytes:
+    # scrypt is deliberately slow, so derive once per secret and process.
+    return hashlib.scrypt(
+        secret.encode("utf-8"),
+        salt=_SCRYPT_SALT,
+        n=2**15,
+        r=8,
+        p=1,
+        maxmem=64 * 1024 * 1024,
+        dklen=32,
+    )
+
+
+def _file_key(secret: str, salt: bytes) -> bytes:
+    # Single-block HKDF-SHA256 (RFC 5869) over the scrypt key; a 32-byte output needs one block.
+    prk = hmac.new(salt, _derive_key(secret), hashlib.sha256).digest()
+    return hmac.new(prk, _FILE_KEY_INFO + b"\x01", hashlib.sha256).digest()
+
+
+@functools.lru_cache(maxsize=32)
+def _fernet_keys(secret: str) -> tuple[bytes, bytes]:
+    # Fernet splits its 32-byte key into (signing key, encryption key).
     digest = hashlib.sha256(secret.encode("utf-8")).digest()
-    return base64.urlsafe_b64encode(digest)
+    return digest[:16], digest[16:]
+
+
+def _derive_fernet_key(secret: str) -> bytes:
+    return base64.urlsafe_b64encode(b"".join(_fernet_keys(secret)))
+
+
+class _FramedStreamEncryptor:
+    """Seal input in fixed-size AES-GCM frames so memory stays bounded by one frame."""
+
+    def __init__(self, secret: str) -> None:
+        salt = os.urandom(_FILE_SALT_SIZE)
+        self._aesgcm = _get_aesgcm()(_file_key(secret, salt))
+        self._prefix = os.urandom(_NONCE_PREFIX_SIZE)
+        self._fields = salt + self._prefix
+        self._header = _MAGIC + self._fields
+        self._index = 0
+        self._buffer = bytearray()
+
+    def update(self, data: bytes) -> bytes:
+        self._buffer += data
+        frames = [self._take_header()]
+        # Keep at least one byte back so the last frame is always emitted by finalize.
+        while len(self._buffer) > _FRAME_SIZE:
+            frames.append(self._seal(bytes(self._buffer[:_FRAME_SIZE]), final=False))
+            del self._buffer[:_FRAME_SIZE]
+        return b"".join(frames)
+
+    def finalize(self) -> bytes:
+        frame = self._seal(bytes(self._buffer), final=True)
+        self._buffer.clear()
+        return self._take_header() + frame
+
+    def _take_header(self) -> bytes:
+        header, self._header = self._header, b""
+        return header
+
+    def _seal(self, plaintext: bytes, final: bool) -> bytes:
+        nonce = self._prefix + struct.pack(">Q", self._index)
+        self._index += 1
+        sealed = self._aesgcm.encrypt(nonce, plaintext, _frame_aad(_MAGIC, self._fields, final))
+        ciphertext, tag = sealed[:-_GCM_TAG_SIZE], sealed[-_GCM_TAG_SIZE:]
+        length = len(ciphertext) | (_FINAL_FRAME_FLAG if final else 0)
+        return _FRAME_HEADER.pack(length) + tag + ciphertext
+
+
+class _FramedDecryptReader(ChunkReader):
+    """Read and open one frame per chunk; plaintext is only released after its frame authenticates."""
+
+    def __init__(self, source: BinaryIO, secret: str, magic: bytes = _MAGIC) -> None:
+        super().__init__()
+        self._source = source
+        self._secret = secret
+        self._magic = magic
+        self._cipher_cls, self._algorithms, self._modes, _, self._invalid_token = _get_cipher_modules()
+        self._key = None
+        self._fields = b""
+        self._prefix = None
+        self._index = 0
+        self._finished = False
+
+    def _next_chunk(self) -> bytes | None:
+        if self._prefix is None:
+            if self._magic == _MAGIC:
+                salt = bytes(self._read_exactly(_FILE_SALT_SIZE))
+                self._key = _file_key(self._secret, salt)
+            else:
+                salt = b""
+                self._key = _derive_key(self._secret)
+            self._prefix = bytes(self._read_exactly(_NONCE_PREFIX_SIZE))
+            self._fields = salt + self._prefix
+        if self._finished:
+            if self._source.read(1):
+                raise self._invalid_token
+            return None
+
+        header = self._read_exactly(_FRAME_HEADER.size + _GCM_TAG_SIZE)
+        (length,) = _FRAME_HEADER.unpack_from(header)
+        final = bool(length & _FINAL_FRAME_FLAG)
+        size = length & ~_FINAL_FRAME_FLAG
+        if size > _FRAME_SIZE:
+            raise self._invalid_token
+        plaintext = self._open(self._read_exactly(size), bytes(header[_FRAME_HEADER.size :]), final)
+        self._finished = final
+        return plaintext
+
+    def _read_exactly(self, size: int) -> bytearray:
+        # readinto lands the frame in one buffer; the cipher then reads it in place.
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        filled = 0
+        while filled < size:
+            count = self._source.readinto(view[filled:])
+            if not count:
+                raise self._invalid_token
+            filled += count
+        return buffer
+
+    def _open(self, ciphertext: bytearray, tag: bytes, final: bool) -> bytes:
+        from cryptography.exceptions import InvalidTag
+
+        nonce = self._prefix + struct.pack(">Q", self._index)
+        self._index += 1
+        decryptor = self._cipher_cls(self._algorithms.AES(self._key), self._modes.GCM(nonce, tag)).decryptor()
+        decryptor.authenticate_additional_data(_frame_aad(self._magic, self._fields, final))
+        plaintext = decryptor.update(ciphertext)
+        try:
+            decryptor.finalize()
+        except InvalidTag as exc:
+            raise self._invalid_token from exc
+        return plaintext
+
+
+class _GCMStreamDecryptor:
+    """Decrypt a single-stream BKEv1 body; the tag is verified in ``finalize``."""
+
+    def __init__(self, secret: str) -> None:
+        self._cipher_cls, self._algorithms, self._modes, _, self._invalid_token = _get_cipher_modules()
+        self._key = _derive_key(secret)
+        self._decryptor = None
+        self._buffer = bytearray()
+
+    def update(self, data: bytes) -> bytes:
+        self._buffer += data
+        if self._decryptor is None:
+            if len(self._buffer) < _GCM_NONCE_SIZE:
+                return b""
+            nonce = bytes(self._buffer[:_GCM_NONCE_SIZE])
+            del self._buffer[:_GCM_NONCE_SIZE]
+            self._decryptor = self._cipher_cls(self._algorithms.AES(self._key), self._modes.GCM(nonce)).decryptor()
+
+        # Hold back the trailing bytes that may turn out to be the tag.
+        ready = len(self._buffer) - _GCM_TAG_SIZE
+        if ready <= 0:
+            return b""
+        ciphertext = bytes(self._buffer[:ready])
+        del self._buffer[:ready]
+        return self._decryptor.update(ciphertext)
+
+    def finalize(self) -> bytes:
+        from cryptography.exceptions import InvalidTag
+
+        if self._decryptor is None or len(self._buffer) != _GCM_TAG_SIZE:
+            raise self._invalid_token
+        try:
+            return self._decryptor.finalize_with_tag(bytes(self._buffer))
+        except InvalidTag as exc:
+            raise self._invalid_token from exc
+
+
+class _FernetStreamDecryptor:
+    """Incrementally decrypt a Fernet token; the HMAC is verified in ``finalize``."""
+
+    def __init__(self, secret: str) -> None:
+        self._cipher_cls, self._algorithms, self._modes, self._padding, self._invalid_token = _get_cipher_modules()
+        self._signing_key, self._encryption_key = _fernet_keys(secret)
+        self._hmac = None
+        self._decryptor = None
+        self._unpadder = None
+        self._carry = b""
+        self._buffer = bytearray()
+
+    def update(self, data: bytes) -> bytes:
+        data = self._carry + data
+        cut = len(data) - len(data) % 4
+        self._carry = data[cut:]
+        try:
+            self._buffer += base64.urlsafe_b64decode(data[:cut])
+        except ValueError as exc:
+            raise self._invalid_token from exc
+
+        if self._decryptor is None:
+            if len(self._buffer) < _FERNET_HEADER_SIZE:
+                return b""
+            header = bytes(self._buffer[:_FERNET_HEADER_SIZE])
+            del self._buffer[:_FERNET_HEADER_SIZE]
+            if header[:1] != _FERNET_VERSION:
+                raise self._invalid_token
+            iv = header[9:_FERNET_HEADER_SIZE]
+            self._hmac = hmac.new(self._signing_key, header, hashlib.sha256)
+            self._decryptor = self._cipher_cls(
+                self._algorithms.AES(self._encryption_key), self._modes.CBC(iv)
+            ).decryptor()
+            self._unpadder = self._padding.PKCS7(self._algorithms.AES.block_size).unpadder()
+
+        # Hold back the trailing bytes that may turn out to be the HMAC.
+        ready = len(self._buffer) - _FERNET_HMAC_SIZE
+        if ready <= 0:
+            return b""
+        ciphertext = bytes(self._buffer[:ready])
+        del self._buffer[:ready]
+        self._hmac.update(ciphertext)
+        return self._unpadder.update(self._decryptor.update(ciphertext))
+
+    def finalize(self) -> bytes:
+        if self._carry or self._decryptor is None or len(self._buffer) != _FERNET_HMAC_SIZE:
+            raise self._invalid_token
+        if not hmac.compare_digest(self._hmac.digest(), bytes(self._buffer)):
+            raise self._invalid_token
+        try:
+            return self._unpadder.update(self._decryptor.finalize()) + self._unpadder.finalize()
+        except ValueError as exc:
+            raise self._invalid_token from exc
+
+
+def _frame_aad(magic: bytes, fields: bytes, final: bool) -> bytes:
+    return magic + fields + (b"\x01" if final else b"\x00")
+
+
+def encrypt_stream(fileobj: BinaryIO, secret: str) -> ChainedReader:
+    encryptor = _FramedStreamEncryptor(secret)
+    return ChainedReader(fileobj, encryptor.update, encryptor.finalize)
+
+
+def decrypt_stream(fileobj: BinaryIO, secret: str) -> ChunkReader:
+    magic = fileobj.read(len(_MAGIC))
+    if magic in (_MAGIC, _MAGIC_V2):
+        return _FramedDecryptReader(fileobj, secret, magic)
+    if magic == _MAGIC_V1:
+        decryptor = _GCMStreamDecryptor(secret)
+    else:
+        # Files written before AES-GCM are Fernet tokens.
+        decryptor = _FernetStreamDecryptor(secret)
+        decryptor.update(magic)
+    return ChainedReader(fileobj, decryptor.update, decryptor.finalize)
+
+
+def is_framed_file(input_path: str) -> bool:
+    """True when ``input_path`` uses the framed format, whose plaintext is authenticated per frame."""
+    with Path(input_path).open("rb") as handle:
+        return handle.read(len(_MAGIC)) in (_MAGIC, _MAGIC_V2)
 
 
 def encrypt_file(input_path: str, secret: str, output_path: str | None = None, remove_original: bool = False) -> str:
@@ -29,12 +329,8 @@ def encrypt_file(input_path: str, secret: str, output_path: str | None = None, r
     target = Path(output_path) if output_path else source.with_suffix(source.suffix + ".enc")
     target.parent.mkdir(parents=True, exist_ok=True)
 
-    fernet_cls = _get_fernet()
-    fernet = fernet_cls(_derive_fernet_key(secret))
-
-    data = source.read_bytes()
-    encrypted = fernet.encrypt(data)
-    target.write_bytes(encrypted)
+    with source.open("rb") as src, target.open("wb") as dst:
+        shutil.copyfileobj(encrypt_stream(src, secret), dst)
 
     if remove_original:
         source.unlink(missing_ok=True)
@@ -53,12 +349,13 @@ def decrypt_file(input_path: str, secret: str, output_path: str | None = None, r
     target = Path(output_path) if output_path else source.with_suffix("")
     target.parent.mkdir(parents=True, exist_ok=True)
 
-    fernet_cls = _get_fernet()
-    fernet = fernet_cls(_derive_fernet_key(secret))
-
-    encrypted = source.read_bytes()
-    decrypted = fernet.decrypt(encrypted)
-    target.write_bytes(decrypted)
+    try:
+        with source.open("rb") as src, target.open("wb") as dst:
+            shutil.copyfileobj(decrypt_stream(src, secret), dst)
+    except Exception:
+        # Never leave unauthenticated plaintext behind.
+        target.unlink(missing_ok=True)
+        raise
 
     if remove_original:
         source.unlink(missing_ok=True)
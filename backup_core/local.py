@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os
 import shutil
+import tempfile
 from pathlib import Path
+from typing import BinaryIO
 
 
 class LocalStorageBackend:
@@ -20,3 +23,20 @@ class LocalStorageBackend:
             shutil.copy2(source, target)
 
         return str(target)
+
+    def store_stream(self, stream: BinaryIO, destination_dir: str, filename: str) -> str:
+        destination = Path(destination_dir)
+        destination.mkdir(parents=True, exist_ok=True)
+        target = destination / filename
+
+        tmp_fd, tmp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix=".part", dir=str(destination))
+        try:
+            with os.fdopen(tmp_fd, "wb") as handle:
+                shutil.copyfileobj(stream, handle)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return str(target)
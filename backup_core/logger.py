@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from django.conf import settings
 
+_listeners: dict[str, QueueListener] = {}
+
 
 def get_logger(name: str = "backup_core") -> logging.Logger:
     logger = logging.getLogger(name)
@@ -20,15 +25,28 @@ def get_logger(name: str = "backup_core") -> logging.Logger:
 
     formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
 
-    file_handler = logging.FileHandler(log_file)
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
-    logger.addHandler(stream_handler)
+
+    # Callers only enqueue records; a listener thread does the file and console writes.
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
 
     # Prevent duplicate lines through root logger handlers (e.g., Celery worker logs).
     logger.propagate = False
 
     return logger
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    # Drain queued records before the interpreter exits.
+    while _listeners:
+        _, listener = _listeners.popitem()
+        listener.stop()
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import io
+import os
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
@@ -10,16 +14,30 @@ from django.utils import timezone
 
 from backup_core.azure import AzureBlobStorageBackend
 from backup_core.base import AdapterError, get_adapter
-from backup_core.compression import compress_file
-from backup_core.encryption import encrypt_file
+from backup_core.chunking import pick_chunk_size
+from backup_core.compression import CODEC_SUFFIXES, compress_stream, compress_stream_zstd
+from backup_core.encryption import encrypt_stream
 from backup_core.gcs import GCSStorageBackend
 from backup_core.local import LocalStorageBackend
 from backup_core.logger import get_logger
 from backup_core.models import BackupArtifact, BackupJob
-from backup_core.notifications import send_slack_notification
+from backup_core.notifications import enqueue_slack_notification
+from backup_core.params import build_connection_params, redact
+from backup_core.pipeline import HashingReader, PrefetchReader, advise_dontneed, advise_sequential
 from backup_core.s3 import S3StorageBackend
 
 
+def run_backup(stdout=None, stderr=None, **options) -> None:
+    """Run backup_db in-process, skipping call_command's per-call parser setup."""
+    command = Command(stdout=stdout, stderr=stderr)
+    command.handle(**{**_default_options(), **options})
+
+
+@functools.lru_cache(maxsize=1)
+def _default_options() -> dict:
+    return vars(Command().create_parser("manage.py", "backup_db").parse_args([]))
+
+
 class Command(BaseCommand):
     help = "Backup a database from CLI."
 
@@ -40,6 +58,12 @@ class Command(BaseCommand):
         parser.add_argument("--output-dir", default=str(getattr(settings, "BACKUP_ROOT", settings.BASE_DIR / "backups")))
         parser.add_argument("--filename")
         parser.add_argument("--compress", action="store_true")
+        parser.add_argument(
+            "--codec",
+            choices=sorted(CODEC_SUFFIXES),
+            default=getattr(settings, "BACKUP_COMPRESSION_CODEC", "gzip"),
+            help="Compression codec for --compress",
+        )
         parser.add_argument("--encrypt-key", help="Secret key to encrypt backup file")
 
         parser.add_argument("--storage", default="local", choices=["local", "s3", "gcs", "azure"])
@@ -56,13 +80,13 @@ class Command(BaseCommand):
         started_at = timezone.now()
 
         tables = self._parse_tables(options.get("tables"))
-        connection_params = self._build_connection_params(options)
+        connection_params = build_connection_params(options)
 
         job = BackupJob.objects.create(
             name=options["name"],
             db_type=options["db_type"],
             backup_type=options["backup_type"],
-            connection_params=self._redact(connection_params),
+            connection_params=redact(connection_params),
             storage_type=options["storage"],
             destination=options.get("output_dir", ""),
             status=BackupJob.STATUS_RUNNING,
@@ -73,7 +97,8 @@ class Command(BaseCommand):
 
         try:
             adapter = get_adapter(options["db_type"], connection_params)
-            adapter.test_connection()
+            adapter.compressed_downstream = bool(options["compress"])
+            adapter.ensure_connection()
             requested_backup_type = options["backup_type"]
             if requested_backup_type == "incremental" and not adapter.supports_incremental:
                 logger.warning(
@@ -94,21 +119,23 @@ class Command(BaseCommand):
             filename = options.get("filename") or self._default_filename(options["name"], options["db_type"])
             output_path = output_dir / filename
 
-            produced_path = Path(adapter.backup(str(output_path), backup_type=options["backup_type"], tables=tables))
-
-            if options["compress"]:
-                produced_path = Path(compress_file(str(produced_path), remove_original=True))
-
-            if options.get("encrypt_key"):
-                produced_path = Path(encrypt_file(str(produced_path), options["encrypt_key"], remove_original=True))
-
-            final_path = self._store_backup(produced_path, options)
-            size_bytes = produced_path.stat().st_size if produced_path.exists() else 0
-            checksum = self._sha256(produced_path) if produced_path.exists() else ""
+            if self._needs_transform(options) and adapter.supports_stream_backup(options["backup_type"], tables):
+                # Pipe the dump tool straight into compress/encrypt/store; no intermediate dump file.
+                file_name = self._artifact_name(output_path, options)
+                source = adapter.backup_stream(backup_type=options["backup_type"], tables=tables)
+                with source, self._transform_stream(source, options) as stream:
+                    reader = HashingReader(stream)
+                    final_path = self._store_backup(reader, file_name, options)
+                size_bytes = reader.bytes_read
+                checksum = reader.hexdigest()
+            else:
+                final_path, size_bytes, checksum, file_name = self._backup_via_file(
+                    adapter, output_path, tables, options
+                )
 
             artifact = BackupArtifact.objects.create(
                 backup_job=job,
-                file_name=produced_path.name,
+                file_name=file_name,
                 file_path=final_path,
                 storage_type=options["storage"],
                 size_bytes=size_bytes,
@@ -132,7 +159,7 @@ class Command(BaseCommand):
             logger.info(success_msg)
             self.stdout.write(self.style.SUCCESS(success_msg))
 
-            send_slack_notification(options.get("slack_webhook_url"), success_msg)
+            enqueue_slack_notification(options.get("slack_webhook_url"), success_msg)
 
         except Exception as exc:
             finished_at = timezone.now()
@@ -145,7 +172,7 @@ class Command(BaseCommand):
             job.save(update_fields=["status", "finished_at", "duration_seconds", "last_error", "updated_at"])
 
             logger.exception("Backup failed: %s", exc)
-            send_slack_notification(options.get("slack_webhook_url"), f"Backup failed: {exc}")
+            enqueue_slack_notification(options.get("slack_webhook_url"), f"Backup failed: {exc}")
             raise CommandError(f"Backup failed: {exc}") from exc
 
     def _default_filename(self, name: str, db_type: str) -> str:
@@ -165,37 +192,85 @@ class Command(BaseCommand):
         items = [item.strip() for item in raw_value.split(",") if item.strip()]
         return items or None
 
-    def _build_connection_params(self, options: dict) -> dict:
-        params = {}
-        for key in ["db_path", "host", "port", "username", "password", "database", "uri"]:
-            value = options.get(key)
-            if value not in (None, ""):
-                if key == "db_path":
-                    params["path"] = value
-                else:
-                    params[key] = value
-        return params
-
-    def _store_backup(self, local_path: Path, options: dict) -> str:
+    def _backup_via_file(self, adapter, output_path: Path, tables, options: dict) -> tuple[str, int, str, str]:
+        """Dump to ``output_path`` and store it; returns (final_path, size_bytes, checksum, file_name)."""
+        produced_path = Path(adapter.backup(str(output_path), backup_type=options["backup_type"], tables=tables))
+        file_name = self._artifact_name(produced_path, options)
+
+        if self._is_final_local_file(produced_path, file_name, options):
+            # Plain local dump already in place: hashing is the only pass left.
+            final_path = str(produced_path)
+            size_bytes = produced_path.stat().st_size
+            checksum = self._sha256(produced_path)
+        else:
+            # Compress, encrypt, store and checksum in a single pass over the dump.
+            with produced_path.open("rb") as source, self._transform_stream(source, options) as stream:
+                reader = HashingReader(stream)
+                final_path = self._store_backup(reader, file_name, options)
+            size_bytes = reader.bytes_read
+            checksum = reader.hexdigest()
+            if file_name != produced_path.name:
+                produced_path.unlink(missing_ok=True)
+        return final_path, size_bytes, checksum, file_name
+
+    def _needs_transform(self, options: dict) -> bool:
+        return bool(options["compress"] or options.get("encrypt_key") or options["storage"] != "local")
+
+    def _is_final_local_file(self, produced_path: Path, file_name: str, options: dict) -> bool:
+        if options["storage"] != "local" or file_name != produced_path.name:
+            return False
+        return produced_path.resolve() == (Path(options["output_dir"]) / file_name).resolve()
+
+    def _artifact_name(self, produced_path: Path, options: dict) -> str:
+        name = produced_path.name
+        if options["compress"]:
+            name = f"{name}{CODEC_SUFFIXES[options['codec']]}"
+        if options.get("encrypt_key"):
+            name = f"{name}.enc"
+        return name
+
+    def _transform_stream(self, source: BinaryIO, options: dict) -> BinaryIO:
+        advise_sequential(source)
+        stream = source
+        chunk_size = pick_chunk_size(self._source_size(source))
+        if options["compress"]:
+            if options["codec"] == "zstd":
+                stream = compress_stream_zstd(stream, chunk_size=chunk_size)
+            else:
+                stream = compress_stream(stream, chunk_size=chunk_size)
+        if options.get("encrypt_key"):
+            stream = encrypt_stream(stream, options["encrypt_key"])
+        if stream is not source:
+            # Compress/encrypt on a worker thread while the storage backend is writing or uploading.
+            stream = PrefetchReader(stream, chunk_size=chunk_size)
+        return stream
+
+    def _source_size(self, source: BinaryIO) -> int | None:
+        try:
+            return os.fstat(source.fileno()).st_size
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+
+    def _store_backup(self, stream: BinaryIO, filename: str, options: dict) -> str:
         storage_type = options["storage"]
 
         if storage_type == "local":
             backend = LocalStorageBackend()
-            return backend.store_file(str(local_path), options["output_dir"])
+            return backend.store_stream(stream, options["output_dir"], filename)
 
         if storage_type == "s3":
             bucket = options.get("bucket")
             if not bucket:
                 raise AdapterError("--bucket is required for S3 storage")
             backend = S3StorageBackend(bucket=bucket, prefix=options.get("prefix", ""), region=options.get("region"))
-            return backend.store_file(str(local_path))
+            return backend.store_stream(stream, filename)
 
         if storage_type == "gcs":
             bucket = options.get("bucket")
             if not bucket:
                 raise AdapterError("--bucket is required for GCS storage")
             backend = GCSStorageBackend(bucket=bucket, prefix=options.get("prefix", ""))
-            return backend.store_file(str(local_path))
+            return backend.store_stream(stream, filename)
 
         if storage_type == "azure":
             container = options.get("container")
@@ -206,20 +281,21 @@ class Command(BaseCommand):
                 prefix=options.get("prefix", ""),
                 connection_string=options.get("azure_connection_string"),
             )
-            return backend.store_file(str(local_path))
+            return backend.store_stream(stream, filename)
 
         raise AdapterError(f"Unsupported storage type: {storage_type}")
 
-    def _redact(self, params: dict) -> dict:
-        result = dict(params)
-        for key in ["password", "uri", "token", "secret", "azure_connection_string"]:
-            if key in result and result[key]:
-                result[key] = "***"
-        return result
-
     def _sha256(self, file_path: Path) -> str:
-        hasher = hashlib.sha256()
         with file_path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: the read/update loop runs in C.
+                digest = hashlib.file_digest(handle, "sha256").hexdigest()
+            else:
+                hasher = hashlib.sha256()
+                chunk_size = pick_chunk_size(file_path.stat().st_size)
+                for chunk in iter(lambda: handle.read(chunk_size), b""):
+                    hasher.update(chunk)
+                digest = hasher.hexdigest()
+            # Hashing is the last pass over a finished local dump, so its pages need not stay cached.
+            advise_dontneed(handle)
+            return digest
@@ -12,14 +12,19 @@ class Command(BaseCommand):
         parser.add_argument("--limit", type=int, default=20)
 
     def handle(self, *args, **options):
-        artifacts = BackupArtifact.objects.select_related("backup_job")[: options["limit"]]
+        rows = list(
+            BackupArtifact.objects.values_list(
+                "id", "backup_job__name", "file_path", "size_bytes", "created_at"
+            )[: options["limit"]]
+        )
 
-        if not artifacts:
+        if not rows:
             self.stdout.write("No backup artifacts found.")
             return
 
-        for artifact in artifacts:
-            self.stdout.write(
-                f"id={artifact.id} job={artifact.backup_job.name} path={artifact.file_path} "
-                f"size={artifact.size_bytes} created={artifact.created_at.isoformat()}"
+        self.stdout.write(
+            "\n".join(
+                f"id={artifact_id} job={job_name} path={file_path} size={size_bytes} created={created_at.isoformat()}"
+                for artifact_id, job_name, file_path, size_bytes, created_at in rows
             )
+        )
@@ -13,29 +13,47 @@ class Command(BaseCommand):
         parser.add_argument("--active-only", action="store_true")
 
     def handle(self, *args, **options):
-        schedules = Schedule.objects.select_related("backup_job")
+        schedules = Schedule.objects.all()
         if options["active_only"]:
             schedules = schedules.filter(is_active=True)
 
-        schedules = schedules[: options["limit"]]
-
-        if not schedules:
+        rows = list(
+            schedules.values_list(
+                "id",
+                "backup_job_id",
+                "backup_job__name",
+                "is_active",
+                "cron_expression",
+                "retry_count",
+                "max_retries",
+                "retry_backoff_seconds",
+                "lease_expires_at",
+                "next_run_at",
+                "last_run_at",
+                "last_error",
+                named=True,
+            )[: options["limit"]]
+        )
+
+        if not rows:
             self.stdout.write("No schedules found.")
             return
 
-        for schedule in schedules:
-            next_run = schedule.next_run_at.isoformat() if schedule.next_run_at else "-"
-            last_run = schedule.last_run_at.isoformat() if schedule.last_run_at else "-"
-            lease_until = schedule.lease_expires_at.isoformat() if schedule.lease_expires_at else "-"
-            err = (schedule.last_error or "").strip()
-            if len(err) > 80:
-                err = f"{err[:77]}..."
-            if not err:
-                err = "-"
-            self.stdout.write(
-                f"id={schedule.id} backup_job_id={schedule.backup_job_id} "
-                f"name={schedule.backup_job.name} active={schedule.is_active} "
-                f"cron='{schedule.cron_expression}' retries={schedule.retry_count}/{schedule.max_retries} "
-                f"backoff={schedule.retry_backoff_seconds}s lease_until={lease_until} "
-                f"next_run={next_run} last_run={last_run} last_error={err}"
-            )
+        self.stdout.write("\n".join(self._format(row) for row in rows))
+
+    def _format(self, row) -> str:
+        next_run = row.next_run_at.isoformat() if row.next_run_at else "-"
+        last_run = row.last_run_at.isoformat() if row.last_run_at else "-"
+        lease_until = row.lease_expires_at.isoformat() if row.lease_expires_at else "-"
+        err = (row.last_error or "").strip()
+        if len(err) > 80:
+            err = f"{err[:77]}..."
+        if not err:
+            err = "-"
+        return (
+            f"id={row.id} backup_job_id={row.backup_job_id} "
+            f"name={row.backup_job__name} active={row.is_active} "
+            f"cron='{row.cron_expression}' retries={row.retry_count}/{row.max_retries} "
+            f"backoff={row.retry_backoff_seconds}s lease_until={lease_until} "
+            f"next_run={next_run} last_run={last_run} last_error={err}"
+        )
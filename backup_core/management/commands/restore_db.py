@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
@@ -9,11 +15,36 @@ from django.db import DatabaseError, connections
 from django.utils import timezone
 
 from backup_core.base import get_adapter
-from backup_core.compression import decompress_file
-from backup_core.encryption import decrypt_file
+from backup_core.compression import (
+    decompress_file,
+    decompress_stream,
+    decompress_stream_zstd,
+    open_decompressed,
+    open_decompressed_zstd,
+)
+from backup_core.cpu import effective_cpu_count
+from backup_core.encryption import decrypt_stream, is_framed_file
 from backup_core.logger import get_logger
 from backup_core.models import BackupArtifact, RestoreJob
-from backup_core.notifications import send_slack_notification
+from backup_core.notifications import enqueue_slack_notification
+from backup_core.params import build_connection_params, redact
+from backup_core.paths import resolve_setting_path
+from backup_core.pipeline import PrefetchReader
+
+STAGING_CHUNK_SIZE = 1024 * 1024
+ENCODING_SUFFIXES = (".enc", ".gz", ".zst")
+_FILE_DECOMPRESSORS = {".gz": open_decompressed, ".zst": open_decompressed_zstd}
+_STREAM_DECOMPRESSORS = {".gz": decompress_stream, ".zst": decompress_stream_zstd}
+
+
+def split_encodings(name: str) -> tuple[str, tuple[str, ...]]:
+    """Split a backup file name into its plain name and encoding suffixes, outermost first."""
+    encodings = []
+    for suffix in ENCODING_SUFFIXES:
+        if name[-len(suffix) :].lower() == suffix:
+            name = name[: -len(suffix)]
+            encodings.append(suffix)
+    return name, tuple(encodings)
 
 
 class Command(BaseCommand):
@@ -35,13 +66,19 @@ class Command(BaseCommand):
         parser.add_argument("--tables", help="Comma-separated tables/collections for selective restore")
         parser.add_argument("--decrypt-key", help="Secret key if file is encrypted")
         parser.add_argument("--slack-webhook-url", help="Slack webhook URL")
+        parser.add_argument(
+            "--restore-concurrency",
+            type=int,
+            default=getattr(settings, "BACKUP_RESTORE_CONCURRENCY", 1),
+            help="Parallel workers: tables/collections for selective restores, pg_restore --jobs for full ones",
+        )
 
     def handle(self, *args, **options):
         logger = get_logger("backup_core.restore")
 
         artifact, backup_file = self._resolve_backup_source(options)
         selected_tables = self._parse_tables(options.get("tables"))
-        connection_params = self._build_connection_params(options)
+        connection_params = build_connection_params(options)
         if options["db_type"] == "sqlite":
             connection_params["allow_create"] = True
 
@@ -60,7 +97,7 @@ class Command(BaseCommand):
             restore_job = RestoreJob.objects.create(
                 backup_job=artifact.backup_job if artifact else None,
                 backup_artifact=artifact,
-                target_params=self._redact(connection_params),
+                target_params=redact(connection_params),
                 selected_tables=selected_tables or [],
                 status=RestoreJob.STATUS_RUNNING,
                 started_at=started_at,
@@ -68,30 +105,23 @@ class Command(BaseCommand):
 
         try:
             adapter = get_adapter(options["db_type"], connection_params)
-            adapter.test_connection()
+            adapter.ensure_connection()
 
             backup_path = Path(backup_file)
             if not backup_path.exists():
                 raise CommandError(f"Backup file does not exist: {backup_path}")
-
-            with tempfile.TemporaryDirectory(prefix="restore_work_") as tmp_dir:
-                working_path = backup_path
-
-                # Handle chained extensions like .gz.enc and single extensions.
-                if working_path.suffix == ".enc":
-                    decrypt_key = options.get("decrypt_key")
-                    if not decrypt_key:
-                        raise CommandError("Backup file is encrypted. Provide --decrypt-key.")
-                    target_path = Path(tmp_dir) / working_path.with_suffix("").name
-                    working_path = Path(decrypt_file(str(working_path), decrypt_key, output_path=str(target_path)))
-
-                if working_path.suffix == ".gz":
-                    target_path = Path(tmp_dir) / working_path.with_suffix("").name
-                    working_path = Path(decompress_file(str(working_path), output_path=str(target_path)))
-
-                if restoring_metadata_db:
-                    connections.close_all()
-                adapter.restore(str(working_path), tables=selected_tables)
+            if artifact is not None and artifact.checksum_sha256:
+                self._verify_checksum(backup_path, artifact.checksum_sha256)
+
+            plain_name, encodings = split_encodings(backup_path.name)
+            if self._can_stream_restore(adapter, backup_path, plain_name, encodings, selected_tables, options):
+                # Decrypt/decompress straight into the restore tool instead of a temp file.
+                with self._open_plain_stream(backup_path, encodings, options) as stream:
+                    adapter.restore_stream(stream, plain_name, tables=selected_tables)
+            else:
+                self._restore_from_file(
+                    adapter, backup_path, plain_name, encodings, selected_tables, options, restoring_metadata_db
+                )
 
             finished_at = timezone.now()
             duration = (finished_at - started_at).total_seconds()
@@ -108,7 +138,7 @@ class Command(BaseCommand):
                 msg = f"{msg} restore_job_id={restore_job.id}"
             logger.info(msg)
             self.stdout.write(self.style.SUCCESS(msg))
-            send_slack_notification(options.get("slack_webhook_url"), msg)
+            enqueue_slack_notification(options.get("slack_webhook_url"), msg)
 
         except Exception as exc:
             finished_at = timezone.now()
@@ -125,9 +155,121 @@ class Command(BaseCommand):
                     logger.exception("Failed to persist RestoreJob failure state.")
 
             logger.exception("Restore failed: %s", exc)
-            send_slack_notification(options.get("slack_webhook_url"), f"Restore failed: {exc}")
+            enqueue_slack_notification(options.get("slack_webhook_url"), f"Restore failed: {exc}")
             raise CommandError(f"Restore failed: {exc}") from exc
 
+    def _verify_checksum(self, backup_path: Path, expected: str) -> None:
+        hasher = hashlib.sha256()
+        buffer = memoryview(bytearray(1024 * 1024))
+        # Unbuffered readinto keeps the data out of Python bytes objects; OpenSSL does the hashing.
+        with backup_path.open("rb", buffering=0) as handle:
+            while size := handle.readinto(buffer):
+                hasher.update(buffer[:size])
+
+        if hasher.hexdigest() != expected:
+            raise CommandError(
+                f"Checksum mismatch for {backup_path}: expected {expected}, got {hasher.hexdigest()}. "
+                "The backup file is corrupted or was modified."
+            )
+
+    def _restore_from_file(
+        self,
+        adapter,
+        backup_path: Path,
+        plain_name: str,
+        encodings: tuple[str, ...],
+        selected_tables: list[str] | None,
+        options: dict,
+        restoring_metadata_db: bool,
+    ) -> None:
+        with tempfile.TemporaryDirectory(prefix="restore_work_") as tmp_dir:
+            working_path = backup_path
+            target_path = os.path.join(tmp_dir, plain_name)
+
+            if encodings == (".gz",):
+                working_path = Path(decompress_file(str(backup_path), output_path=target_path))
+            elif encodings:
+                # Decrypt and decompress in one pass so only the final plaintext touches the disk.
+                try:
+                    with self._open_plain_stream(backup_path, encodings, options) as stream:
+                        with open(target_path, "wb") as dst:
+                            shutil.copyfileobj(stream, dst, STAGING_CHUNK_SIZE)
+                except Exception:
+                    Path(target_path).unlink(missing_ok=True)
+                    raise
+                working_path = Path(target_path)
+
+            if restoring_metadata_db:
+                connections.close_all()
+            self._restore(adapter, working_path, selected_tables, options["restore_concurrency"])
+
+    def _can_stream_restore(
+        self,
+        adapter,
+        backup_path: Path,
+        plain_name: str,
+        encodings: tuple[str, ...],
+        tables: list[str] | None,
+        options: dict,
+    ) -> bool:
+        if not encodings:
+            return False
+        # Legacy encrypted formats release plaintext before it is authenticated; keep those on disk.
+        if encodings[0] == ".enc" and options.get("decrypt_key") and not is_framed_file(str(backup_path)):
+            return False
+        if self._restore_workers(adapter, plain_name, tables, options["restore_concurrency"]) > 1:
+            return False
+        return adapter.supports_stream_restore(plain_name, tables)
+
+    @contextmanager
+    def _open_plain_stream(self, backup_path: Path, encodings: tuple[str, ...], options: dict) -> Iterator[BinaryIO]:
+        with ExitStack() as stack:
+            if encodings[0] != ".enc":
+                yield stack.enter_context(_FILE_DECOMPRESSORS[encodings[0]](str(backup_path)))
+                return
+
+            decrypt_key = options.get("decrypt_key")
+            if not decrypt_key:
+                raise CommandError("Backup file is encrypted. Provide --decrypt-key.")
+            stream = stack.enter_context(backup_path.open("rb"))
+            stream = stack.enter_context(decrypt_stream(stream, decrypt_key))
+            if encodings[1:]:
+                # Decrypt on a worker thread while this thread inflates, keeping two cores busy.
+                stream = stack.enter_context(PrefetchReader(stream))
+                stream = stack.enter_context(_STREAM_DECOMPRESSORS[encodings[1]](stream))
+            yield stream
+
+    def _restore_workers(self, adapter, backup_name: str, tables: list[str] | None, concurrency: int) -> int:
+        if tables:
+            if not adapter.supports_parallel_table_restore:
+                return 1
+            limit = len(tables)
+        else:
+            if not adapter.supports_parallel_full_restore(backup_name):
+                return 1
+            limit = int(concurrency or 1)
+        return max(min(int(concurrency or 1), effective_cpu_count(), limit), 1)
+
+    def _restore(self, adapter, working_path: Path, tables: list[str] | None, concurrency: int) -> None:
+        workers = self._restore_workers(adapter, working_path.name, tables, concurrency)
+        if workers <= 1:
+            adapter.restore(str(working_path), tables=tables)
+            return
+        if not tables:
+            adapter.restore_parallel(str(working_path), workers)
+            return
+
+        # Each table is a separate pg_restore/mongorestore process, so threads are enough.
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="restore") as executor:
+            futures = [executor.submit(adapter.restore_table, str(working_path), table) for table in tables]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
     def _resolve_backup_source(self, options: dict):
         artifact = None
         backup_file = options.get("backup_file")
@@ -157,31 +299,14 @@ class Command(BaseCommand):
         items = [item.strip() for item in raw_value.split(",") if item.strip()]
         return items or None
 
-    def _build_connection_params(self, options: dict) -> dict:
-        params = {}
-        for key in ["db_path", "host", "port", "username", "password", "database", "uri"]:
-            value = options.get(key)
-            if value not in (None, ""):
-                if key == "db_path":
-                    params["path"] = value
-                else:
-                    params[key] = value
-        return params
-
-    def _redact(self, params: dict) -> dict:
-        result = dict(params)
-        for key in ["password", "uri", "token", "secret"]:
-            if key in result and result[key]:
-                result[key] = "***"
-        return result
-
     def _is_restoring_metadata_db(self, options: dict, connection_params: dict) -> bool:
         if options.get("db_type") != "sqlite":
             return False
 
-        metadata_db_path = Path(settings.DATABASES["default"]["NAME"]).resolve()
-        default_target_path = Path(
-            getattr(settings, "TARGET_SQLITE_DB_PATH", settings.DATABASES["default"]["NAME"])
-        ).resolve()
-        target_db_path = Path(connection_params.get("path") or default_target_path).resolve()
-        return target_db_path == metadata_db_path
+        metadata_db_path = resolve_setting_path(settings.DATABASES["default"]["NAME"])
+        target_db_path = connection_params.get("path")
+        if not target_db_path:
+            default_target_path = getattr(settings, "TARGET_SQLITE_DB_PATH", metadata_db_path)
+            return resolve_setting_path(default_target_path) == metadata_db_path
+        # User-supplied paths are resolved afresh; symlinks under them may change between runs.
+        return Path(target_db_path).resolve() == metadata_db_path
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import functools
 import io
 import os
-import time
+import threading
 
 from django.conf import settings
 from django.core.management import call_command
@@ -10,16 +11,47 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from backup_core.logger import get_logger
+from backup_core.management.commands.backup_db import run_backup
 from backup_core.models import Schedule
+from backup_core.params import connection_options, redacted_keys
 from backup_core.scheduler import (
-    claim_schedule,
-    get_due_schedules,
+    SCHEDULE_DISABLED_FIELDS,
+    SCHEDULE_FAILED_FIELDS,
+    SCHEDULE_LEASE_FIELDS,
+    SCHEDULE_RAN_FIELDS,
+    claim_due_schedules,
     get_next_run_at,
     mark_schedule_failed,
     mark_schedule_ran,
+    renew_schedule_lease,
+    seconds_until_next_run,
 )
 
 
+class _DiscardStream(io.TextIOBase):
+    """Text sink for --quiet: backup output is dropped as it is written instead of buffered for the whole pass."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+_DISCARD = _DiscardStream()
+
+
+def run_scheduler(stdout=None, stderr=None, **options) -> None:
+    """Run run_scheduler in-process, skipping call_command's per-call parser setup."""
+    command = Command(stdout=stdout, stderr=stderr)
+    command.handle(**{**_default_options(), **options})
+
+
+@functools.lru_cache(maxsize=1)
+def _default_options() -> dict:
+    return vars(Command().create_parser("manage.py", "run_scheduler").parse_args([]))
+
+
 class Command(BaseCommand):
     help = "Run scheduled backup jobs from Schedule records."
 
@@ -35,6 +67,11 @@ class Command(BaseCommand):
         parser.add_argument("--schedule-id", type=int, help="Run only one schedule ID")
         parser.add_argument("--dry-run", action="store_true", help="Show what would run without executing backups")
         parser.add_argument("--quiet", action="store_true", help="Suppress command stdout output")
+        parser.add_argument(
+            "--use-call-command",
+            action="store_true",
+            help="Dispatch backups through call_command instead of running them in-process",
+        )
         parser.add_argument(
             "--lease-seconds",
             type=int,
@@ -51,8 +88,10 @@ class Command(BaseCommand):
         max_jobs = max(options["max_jobs"], 1)
         schedule_id = options.get("schedule_id")
         lease_seconds = max(int(options["lease_seconds"]), 1)
-        command_stdout = io.StringIO() if quiet else self.stdout
-        command_stderr = io.StringIO() if quiet else self.stderr
+        command_stdout = _DISCARD if quiet else self.stdout
+        command_stderr = _DISCARD if quiet else self.stderr
+        self.use_call_command = options["use_call_command"]
+        self.wake_event = threading.Event()
 
         if not quiet:
             self.stdout.write(self.style.SUCCESS("Scheduler started."))
@@ -73,7 +112,17 @@ class Command(BaseCommand):
                     self.stdout.write(self.style.SUCCESS(f"Scheduler finished. processed={processed}"))
                 break
 
-            time.sleep(interval)
+            self.wake_event.wait(self._sleep_seconds(interval, processed, max_jobs, dry_run, schedule_id))
+            self.wake_event.clear()
+
+    def _sleep_seconds(self, interval: int, processed: int, max_jobs: int, dry_run: bool, schedule_id: int | None):
+        if processed >= max_jobs and not dry_run:
+            # The pass hit --max-jobs, so more schedules are probably due already.
+            return 0
+        remaining = seconds_until_next_run(schedule_id=schedule_id)
+        if remaining is None:
+            return interval
+        return min(interval, max(remaining, 1))
 
     def _run_pass(
         self,
@@ -86,70 +135,94 @@ class Command(BaseCommand):
         command_stderr,
     ) -> int:
         now = timezone.now()
-        schedules = get_due_schedules(now)
-
-        if schedule_id is not None:
-            schedules = schedules.filter(id=schedule_id)
-
-        schedule_ids = list(schedules.values_list("id", flat=True)[:max_jobs])
+        schedules = claim_due_schedules(max_jobs, lease_seconds=lease_seconds, now=now, schedule_id=schedule_id)
 
-        if not schedule_ids:
+        if not schedules:
             logger.info("No due schedules at %s", now.isoformat())
             return 0
 
         processed = 0
-        for schedule_id_value in schedule_ids:
-            schedule = claim_schedule(schedule_id_value, lease_seconds=lease_seconds, now=now)
-            if schedule is None:
-                continue
-
-            processed += 1
-            try:
-                self._run_schedule(
-                    schedule,
-                    logger=logger,
-                    dry_run=dry_run,
-                    now=now,
-                    command_stdout=command_stdout,
-                    command_stderr=command_stderr,
-                )
-            except Exception as exc:  # pragma: no cover
-                try:
-                    next_run_at = get_next_run_at(schedule.cron_expression, after=now)
-                except ValueError:
-                    schedule.is_active = False
-                    schedule.last_error = str(exc)[:4000]
-                    schedule.lease_expires_at = None
-                    schedule.save(update_fields=["is_active", "last_error", "lease_expires_at"])
-                    logger.exception(
-                        "Schedule %s disabled because cron is invalid and cannot compute next run: %s",
-                        schedule.id,
-                        exc,
-                    )
-                    continue
-
-                failure = mark_schedule_failed(schedule, str(exc), next_run_at=next_run_at, now=now)
-                if failure["state"] == "retrying":
-                    logger.exception(
-                        "Schedule %s failed (attempt %s/%s). Retry in %ss at %s: %s",
-                        schedule.id,
-                        failure["attempt"],
-                        failure["max_retries"],
-                        failure["delay_seconds"],
-                        failure["next_run_at"].isoformat() if failure["next_run_at"] else "-",
-                        exc,
-                    )
+        batched = []
+        try:
+            for schedule in schedules:
+                # Each lease is renewed just before its backup, so a slow pass cannot let later ones lapse.
+                if not dry_run and not renew_schedule_lease(schedule, lease_seconds=lease_seconds):
+                    logger.warning("Schedule %s was re-claimed by another scheduler; skipping it", schedule.id)
                 else:
-                    logger.exception(
-                        "Schedule %s failed after max retries. Next cron run at %s: %s",
-                        schedule.id,
-                        failure["next_run_at"].isoformat() if failure["next_run_at"] else "-",
-                        exc,
+                    update_fields = self._process_schedule(
+                        schedule,
+                        logger=logger,
+                        dry_run=dry_run,
+                        now=now,
+                        command_stdout=command_stdout,
+                        command_stderr=command_stderr,
                     )
+                    if update_fields is SCHEDULE_LEASE_FIELDS:
+                        batched.append(schedule)
+                    else:
+                        # Written as soon as it finishes, while this scheduler still holds the lease.
+                        schedule.save(update_fields=update_fields)
+                processed += 1
+        finally:
+            # Dry-run rows and the leases an interrupted pass still holds are released in one UPDATE.
+            for schedule in schedules[processed:]:
+                schedule.lease_expires_at = None
+            batched.extend(schedules[processed:])
+            if batched:
+                Schedule.objects.bulk_update(batched, SCHEDULE_LEASE_FIELDS)
 
         return processed
 
-    def _run_schedule(self, schedule: Schedule, logger, dry_run: bool, now, command_stdout, command_stderr):
+    def _process_schedule(
+        self, schedule: Schedule, logger, dry_run: bool, now, command_stdout, command_stderr
+    ) -> list[str]:
+        """Run one schedule and return the fields its outcome changed."""
+        try:
+            return self._run_schedule(
+                schedule,
+                logger=logger,
+                dry_run=dry_run,
+                now=now,
+                command_stdout=command_stdout,
+                command_stderr=command_stderr,
+            )
+        except Exception as exc:  # pragma: no cover
+            try:
+                next_run_at = get_next_run_at(schedule.cron_expression, after=now)
+            except ValueError:
+                schedule.is_active = False
+                schedule.last_error = str(exc)[:4000]
+                schedule.lease_expires_at = None
+                logger.exception(
+                    "Schedule %s disabled because cron is invalid and cannot compute next run: %s",
+                    schedule.id,
+                    exc,
+                )
+                return SCHEDULE_DISABLED_FIELDS
+
+            failure = mark_schedule_failed(schedule, str(exc), next_run_at=next_run_at, now=now, save=False)
+            if failure["state"] == "retrying":
+                logger.exception(
+                    "Schedule %s failed (attempt %s/%s). Retry in %ss at %s: %s",
+                    schedule.id,
+                    failure["attempt"],
+                    failure["max_retries"],
+                    failure["delay_seconds"],
+                    failure["next_run_at"].isoformat() if failure["next_run_at"] else "-",
+                    exc,
+                )
+            else:
+                logger.exception(
+                    "Schedule %s failed after max retries. Next cron run at %s: %s",
+                    schedule.id,
+                    failure["next_run_at"].isoformat() if failure["next_run_at"] else "-",
+                    exc,
+                )
+            return SCHEDULE_FAILED_FIELDS
+
+    def _run_schedule(
+        self, schedule: Schedule, logger, dry_run: bool, now, command_stdout, command_stderr
+    ) -> list[str]:
         template = schedule.backup_job
 
         try:
@@ -166,8 +239,7 @@ class Command(BaseCommand):
                 next_run.isoformat(),
             )
             schedule.lease_expires_at = None
-            schedule.save(update_fields=["lease_expires_at"])
-            return
+            return SCHEDULE_LEASE_FIELDS
 
         backup_options = self._build_backup_options(template)
         logger.info(
@@ -178,13 +250,17 @@ class Command(BaseCommand):
             template.storage_type,
         )
 
-        call_command(
-            "backup_db",
-            stdout=command_stdout,
-            stderr=command_stderr,
-            **backup_options,
-        )
-        mark_schedule_ran(schedule, next_run_at=next_run)
+        if self.use_call_command:
+            call_command(
+                "backup_db",
+                stdout=command_stdout,
+                stderr=command_stderr,
+                **backup_options,
+            )
+        else:
+            run_backup(stdout=command_stdout, stderr=command_stderr, **backup_options)
+        mark_schedule_ran(schedule, next_run_at=next_run, save=False)
+        return SCHEDULE_RAN_FIELDS
 
     def _build_backup_options(self, template):
         params = dict(template.connection_params or {})
@@ -202,7 +278,7 @@ class Command(BaseCommand):
             "compress": template.is_compressed,
         }
 
-        self._merge_db_connection_params(options, params)
+        options.update(connection_options(params))
         self._merge_storage_options(options, params)
 
         tables = params.get("tables")
@@ -221,21 +297,6 @@ class Command(BaseCommand):
 
         return options
 
-    def _merge_db_connection_params(self, options: dict, params: dict):
-        mapping = {
-            "path": "db_path",
-            "host": "host",
-            "port": "port",
-            "username": "username",
-            "password": "password",
-            "database": "database",
-            "uri": "uri",
-        }
-        for source_key, target_key in mapping.items():
-            value = params.get(source_key)
-            if value not in (None, ""):
-                options[target_key] = value
-
     def _merge_storage_options(self, options: dict, params: dict):
         mapping = {
             "bucket": "bucket",
@@ -252,11 +313,7 @@ class Command(BaseCommand):
                 options[target_key] = value
 
     def _ensure_non_redacted(self, params: dict):
-        redacted_fields = [
-            key
-            for key in ["password", "uri", "azure_connection_string", "token", "secret"]
-            if str(params.get(key, "")).strip() == "***"
-        ]
+        redacted_fields = redacted_keys(params)
         if redacted_fields:
             joined = ", ".join(redacted_fields)
             raise ValueError(
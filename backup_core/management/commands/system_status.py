@@ -1,44 +1,57 @@
 from __future__ import annotations
 
 import os
-from pathlib import Path
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.utils import timezone
 
-from backup_core.models import BackupArtifact, BackupJob, RestoreJob, Schedule
+from backup_core.counters import read_counters, reconcile_counters
+from backup_core.models import BackupArtifact, RestoreJob, Schedule
+from backup_core.paths import resolve_setting_path
+from backup_core.scheduler import due_schedule_filter
 
 
 class Command(BaseCommand):
     help = "Show one-shot status for backup system health."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--exact",
+            action="store_true",
+            help="Recount jobs/restores from history and reconcile the stored counters",
+        )
+
     def handle(self, *args, **options):
         now = timezone.now()
-        metadata_db = Path(settings.DATABASES["default"]["NAME"]).resolve()
-        target_db = Path(getattr(settings, "TARGET_SQLITE_DB_PATH", metadata_db)).resolve()
-        backup_root = Path(getattr(settings, "BACKUP_ROOT", settings.BASE_DIR / "backups")).resolve()
-        log_file = Path(getattr(settings, "BACKUP_LOG_FILE", settings.BASE_DIR / "logs" / "backup.log")).resolve()
-
-        total_jobs = BackupJob.objects.count()
-        success_jobs = BackupJob.objects.filter(status=BackupJob.STATUS_SUCCESS).count()
-        failed_jobs = BackupJob.objects.filter(status=BackupJob.STATUS_FAILED).count()
+        metadata_db = resolve_setting_path(settings.DATABASES["default"]["NAME"])
+        target_db = resolve_setting_path(getattr(settings, "TARGET_SQLITE_DB_PATH", metadata_db))
+        backup_root = resolve_setting_path(getattr(settings, "BACKUP_ROOT", settings.BASE_DIR / "backups"))
+        log_file = resolve_setting_path(getattr(settings, "BACKUP_LOG_FILE", settings.BASE_DIR / "logs" / "backup.log"))
+
+        counters = reconcile_counters() if options["exact"] else read_counters()
         total_artifacts = BackupArtifact.objects.count()
-        total_restores = RestoreJob.objects.count()
-        failed_restores = RestoreJob.objects.filter(status=RestoreJob.STATUS_FAILED).count()
-        active_schedules = Schedule.objects.filter(is_active=True).count()
-        due_schedules = Schedule.objects.filter(is_active=True).filter(
-            Q(next_run_at__isnull=True) | Q(next_run_at__lte=now)
-        ).filter(
-            Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now)
-        ).count()
-        leased_schedules = Schedule.objects.filter(is_active=True, lease_expires_at__gt=now).count()
-
-        latest_artifact = BackupArtifact.objects.select_related("backup_job").first()
-        latest_restore = RestoreJob.objects.select_related("backup_artifact").first()
-        next_schedule = Schedule.objects.filter(is_active=True).exclude(next_run_at__isnull=True).order_by("next_run_at").first()
+        schedule_counts = Schedule.objects.aggregate(
+            active=Count("id", filter=Q(is_active=True)),
+            due_now=Count("id", filter=due_schedule_filter(now)),
+            leased=Count("id", filter=Q(is_active=True, lease_expires_at__gt=now)),
+        )
+
+        latest_artifact = (
+            BackupArtifact.objects.select_related("backup_job")
+            .only("id", "created_at", "file_path", "backup_job__name")
+            .first()
+        )
+        latest_restore = RestoreJob.objects.only("id", "status", "backup_artifact_id", "created_at").first()
+        next_schedule = (
+            Schedule.objects.filter(is_active=True)
+            .exclude(next_run_at__isnull=True)
+            .only("id", "backup_job_id", "next_run_at")
+            .order_by("next_run_at")
+            .first()
+        )
 
         broker_url = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
         backend_url = os.environ.get("CELERY_RESULT_BACKEND", "redis://localhost:6379/1")
@@ -52,10 +65,14 @@ class Command(BaseCommand):
         self.stdout.write(f"celery_broker={self._safe_url(broker_url)}")
         self.stdout.write(f"celery_backend={self._safe_url(backend_url)}")
         self.stdout.write(
-            f"backup_jobs total={total_jobs} success={success_jobs} failed={failed_jobs} artifacts={total_artifacts}"
+            f"backup_jobs total={counters.jobs_total} success={counters.jobs_success} "
+            f"failed={counters.jobs_failed} artifacts={total_artifacts}"
+        )
+        self.stdout.write(f"restore_jobs total={counters.restores_total} failed={counters.restores_failed}")
+        self.stdout.write(
+            f"schedules active={schedule_counts['active']} due_now={schedule_counts['due_now']} "
+            f"leased={schedule_counts['leased']}"
         )
-        self.stdout.write(f"restore_jobs total={total_restores} failed={failed_restores}")
-        self.stdout.write(f"schedules active={active_schedules} due_now={due_schedules} leased={leased_schedules}")
 
         if next_schedule:
             self.stdout.write(
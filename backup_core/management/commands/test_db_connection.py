@@ -3,6 +3,7 @@ from __future__ import annotations
 from django.core.management.base import BaseCommand, CommandError
 
 from backup_core.base import AdapterError, get_adapter
+from backup_core.params import build_connection_params
 
 
 class Command(BaseCommand):
@@ -19,7 +20,7 @@ class Command(BaseCommand):
         parser.add_argument("--uri")
 
     def handle(self, *args, **options):
-        connection_params = self._build_connection_params(options)
+        connection_params = build_connection_params(options)
 
         try:
             adapter = get_adapter(options["db_type"], connection_params)
@@ -28,14 +29,3 @@ class Command(BaseCommand):
             raise CommandError(str(exc)) from exc
 
         self.stdout.write(self.style.SUCCESS("Connection test successful."))
-
-    def _build_connection_params(self, options: dict) -> dict:
-        params = {}
-        for key in ["db_path", "host", "port", "username", "password", "database", "uri"]:
-            value = options.get(key)
-            if value not in (None, ""):
-                if key == "db_path":
-                    params["path"] = value
-                else:
-                    params[key] = value
-        return params
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.11 on 2026-10-14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("backup_core", "0002_schedule_reliability_fields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="backupartifact",
+            index=models.Index(fields=["storage_type", "-created_at"], name="backup_core_storage_66810a_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="backupartifact",
+            index=models.Index(fields=["is_compressed", "is_encrypted"], name="backup_core_is_comp_f253fd_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="backupjob",
+            index=models.Index(fields=["status", "-created_at"], name="backup_core_status_96c473_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="backupjob",
+            index=models.Index(fields=["storage_type", "-created_at"], name="backup_core_storage_9758bf_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="backupjob",
+            index=models.Index(fields=["db_type", "backup_type"], name="backup_core_db_type_205cac_idx"),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.11 on 2026-10-14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("backup_core", "0003_backup_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="backupartifact",
+            index=models.Index(fields=["-created_at"], name="backup_core_created_3c4d95_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="backupartifact",
+            index=models.Index(fields=["backup_job", "-created_at"], name="backup_core_backup__08b976_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="restorejob",
+            index=models.Index(fields=["status", "-created_at"], name="backup_core_status_eedb24_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(fields=["is_active", "next_run_at"], name="backup_core_is_acti_76d03d_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="schedule",
+            index=models.Index(fields=["is_active", "lease_expires_at"], name="backup_core_is_acti_5fd5a0_idx"),
+        ),
+    ]
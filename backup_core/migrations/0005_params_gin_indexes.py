@@ -0,0 +1,35 @@
+# Generated by Django 5.2.11 on 2026-10-14
+
+from django.db import migrations
+
+GIN_INDEXES = [
+    ("bj_params_gin", "backup_core_backupjob", "connection_params"),
+    ("rj_params_gin", "backup_core_restorejob", "target_params"),
+]
+
+
+def create_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, table, column in GIN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ("{column}" jsonb_path_ops)'
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in GIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("backup_core", "0004_scheduler_status_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+    ]
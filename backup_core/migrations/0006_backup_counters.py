@@ -0,0 +1,53 @@
+# Generated by Django 5.2.11 on 2026-10-14
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def seed_counters(apps, schema_editor):
+    BackupCounters = apps.get_model("backup_core", "BackupCounters")
+    BackupJob = apps.get_model("backup_core", "BackupJob")
+    RestoreJob = apps.get_model("backup_core", "RestoreJob")
+
+    jobs = BackupJob.objects.aggregate(
+        total=Count("id"),
+        success=Count("id", filter=Q(status="success")),
+        failed=Count("id", filter=Q(status="failed")),
+    )
+    restores = RestoreJob.objects.aggregate(total=Count("id"), failed=Count("id", filter=Q(status="failed")))
+    BackupCounters.objects.update_or_create(
+        id=1,
+        defaults={
+            "jobs_total": jobs["total"],
+            "jobs_success": jobs["success"],
+            "jobs_failed": jobs["failed"],
+            "restores_total": restores["total"],
+            "restores_failed": restores["failed"],
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("backup_core", "0005_params_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BackupCounters",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("jobs_total", models.BigIntegerField(default=0)),
+                ("jobs_success", models.BigIntegerField(default=0)),
+                ("jobs_failed", models.BigIntegerField(default=0)),
+                ("restores_total", models.BigIntegerField(default=0)),
+                ("restores_failed", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name_plural": "backup counters",
+            },
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
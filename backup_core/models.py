@@ -45,10 +45,23 @@ class BackupJob(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "-created_at"]),
+            models.Index(fields=["storage_type", "-created_at"]),
+            models.Index(fields=["db_type", "backup_type"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.name} ({self.db_type})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so saves only count real transitions (see backup_core.counters).
+        if "status" in instance.__dict__:
+            instance._counted_status = instance.status
+        return instance
+
 
 class BackupArtifact(models.Model):
     backup_job = models.ForeignKey(BackupJob, on_delete=models.CASCADE, related_name="artifacts")
@@ -63,6 +76,12 @@ class BackupArtifact(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["-created_at"]),
+            models.Index(fields=["backup_job", "-created_at"]),
+            models.Index(fields=["storage_type", "-created_at"]),
+            models.Index(fields=["is_compressed", "is_encrypted"]),
+        ]
 
     def __str__(self) -> str:
         return self.file_name
@@ -106,10 +125,21 @@ class RestoreJob(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "-created_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"RestoreJob #{self.id} ({self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so saves only count real transitions (see backup_core.counters).
+        if "status" in instance.__dict__:
+            instance._counted_status = instance.status
+        return instance
+
 
 class Schedule(models.Model):
     backup_job = models.ForeignKey(BackupJob, on_delete=models.CASCADE, related_name="schedules")
@@ -126,6 +156,29 @@ class Schedule(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["is_active", "next_run_at"]),
+            models.Index(fields=["is_active", "lease_expires_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.backup_job.name}: {self.cron_expression}"
+
+
+class BackupCounters(models.Model):
+    """Single-row running totals of jobs and restores, kept current by backup_core.counters."""
+
+    SINGLETON_ID = 1
+
+    jobs_total = models.BigIntegerField(default=0)
+    jobs_success = models.BigIntegerField(default=0)
+    jobs_failed = models.BigIntegerField(default=0)
+    restores_total = models.BigIntegerField(default=0)
+    restores_failed = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "backup counters"
+
+    def __str__(self) -> str:
+        return f"BackupCounters (jobs={self.jobs_total}, restores={self.restores_total})"
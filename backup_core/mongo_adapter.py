@@ -1,19 +1,29 @@
 from __future__ import annotations
 
-import os
 import shutil
-import subprocess
 import tempfile
 from pathlib import Path
-from typing import Iterable
-from urllib.parse import unquote, urlparse
+from typing import BinaryIO, Iterable
 
-from .base import AdapterError, DatabaseAdapter
+from django.conf import settings
+
+from .base import (
+    AdapterError,
+    CommandOutputStream,
+    DatabaseAdapter,
+    parse_connection_uri,
+    run_command,
+    run_with_stream,
+)
+from .cpu import effective_cpu_count
+
+MONGO_URI_SCHEMES = frozenset({"mongodb", "mongodb+srv"})
 
 
 class MongoAdapter(DatabaseAdapter):
     db_type = "mongo"
     supports_selective_restore = True
+    supports_parallel_table_restore = True
 
     def __init__(self, connection_params: dict | None = None) -> None:
         super().__init__(connection_params)
@@ -60,53 +70,75 @@ class MongoAdapter(DatabaseAdapter):
         self.effective_backup_type(backup_type)
 
         self._require_binary("mongodump")
-        database = self._required_database()
+        self._required_database()
 
         output = Path(output_path)
         output.parent.mkdir(parents=True, exist_ok=True)
 
+        self._run_command(self._backup_command(f"--archive={output}", tables), "MongoDB backup")
+        return str(output)
+
+    def supports_stream_backup(self, backup_type: str = "full", tables: Iterable[str] | None = None) -> bool:
+        return True
+
+    def backup_stream(self, backup_type: str = "full", tables: Iterable[str] | None = None) -> BinaryIO:
+        self.effective_backup_type(backup_type)
+        self._require_binary("mongodump")
+        # A bare --archive makes mongodump write the archive to stdout.
+        return CommandOutputStream(self._backup_command("--archive", tables), "MongoDB backup")
+
+    def _backup_command(self, archive_arg: str, tables: Iterable[str] | None) -> list[str]:
+        database = self._required_database()
         command = [
             "mongodump",
-            f"--archive={output}",
+            archive_arg,
             "--quiet",
+            f"--numParallelCollections={self._parallel_collections(tables)}",
         ]
         command.extend(self._connection_args())
         command.extend(["--db", database])
         command.extend(self._namespace_filters(database, tables))
-
-        self._run_command(command, "MongoDB backup")
-        return str(output)
+        return command
 
     def restore(self, backup_file: str, tables: Iterable[str] | None = None) -> None:
         source = Path(backup_file)
         if not source.exists():
             raise AdapterError(f"Backup file not found: {source}")
 
+        self._run_command(self._restore_command(f"--archive={source}", tables), "MongoDB restore")
+
+    def supports_stream_restore(self, backup_name: str, tables: Iterable[str] | None = None) -> bool:
+        return True
+
+    def restore_stream(self, stream: BinaryIO, backup_name: str, tables: Iterable[str] | None = None) -> None:
+        # A bare --archive makes mongorestore read the archive from stdin.
+        self._run_command(self._restore_command("--archive", tables), "MongoDB restore", stdin_stream=stream)
+
+    def _restore_command(self, archive_arg: str, tables: Iterable[str] | None) -> list[str]:
         self._require_binary("mongorestore")
 
+        workers = self._parallelism()
         command = [
             "mongorestore",
-            f"--archive={source}",
+            archive_arg,
             "--drop",
             "--quiet",
+            f"--numParallelCollections={self._parallel_collections(tables)}",
+            f"--numInsertionWorkersPerCollection={workers}",
         ]
         command.extend(self._connection_args())
 
         if tables:
             database = self._required_database()
             command.extend(self._namespace_filters(database, tables))
+        return command
 
-        self._run_command(command, "MongoDB restore")
-
-    def _run_command(self, command: list[str], action: str) -> None:
+    def _run_command(self, command: list[str], action: str, stdin_stream: BinaryIO | None = None) -> None:
         try:
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                env=os.environ.copy(),
-                check=False,
-            )
+            if stdin_stream is None:
+                result = run_command(command)
+            else:
+                result = run_with_stream(command, stdin_stream)
         except OSError as exc:
             raise AdapterError(f"{action} failed: {exc}") from exc
 
@@ -116,6 +148,18 @@ class MongoAdapter(DatabaseAdapter):
                 details = "Unknown command failure."
             raise AdapterError(f"{action} failed: {details}")
 
+    def _parallelism(self) -> int:
+        configured = int(getattr(settings, "BACKUP_MONGO_PARALLELISM", 0) or 0)
+        if configured > 0:
+            return configured
+        # Half the cores: the other half goes to compressing/encrypting the archive stream.
+        return max(1, effective_cpu_count() // 2)
+
+    def _parallel_collections(self, collections: Iterable[str] | None) -> int:
+        workers = self._parallelism()
+        names = [name for name in (str(item).strip() for item in collections or []) if name]
+        return min(workers, len(names)) if names else workers
+
     def _require_binary(self, binary_name: str) -> None:
         if shutil.which(binary_name):
             return
@@ -198,19 +242,11 @@ class MongoAdapter(DatabaseAdapter):
         if not uri:
             return params
 
-        parsed = urlparse(str(uri))
-        if parsed.scheme not in ("mongodb", "mongodb+srv"):
+        # Parsed once per distinct URI; explicit params win over values embedded in it.
+        parsed = parse_connection_uri(str(uri), MONGO_URI_SCHEMES)
+        if parsed is None:
             raise AdapterError("MongoDB URI must start with mongodb:// or mongodb+srv://")
-
-        if "username" not in params and parsed.username:
-            params["username"] = unquote(parsed.username)
-        if "password" not in params and parsed.password:
-            params["password"] = unquote(parsed.password)
-        if "host" not in params and parsed.hostname:
-            params["host"] = parsed.hostname
-        if "port" not in params and parsed.port:
-            params["port"] = parsed.port
-        if "database" not in params and parsed.path and parsed.path != "/":
-            params["database"] = unquote(parsed.path.lstrip("/"))
+        for key, value in parsed:
+            params.setdefault(key, value)
 
         return params
@@ -2,12 +2,21 @@ from __future__ import annotations
 
 import os
 import shutil
-import subprocess
 from pathlib import Path
-from typing import Iterable
-from urllib.parse import unquote, urlparse
+from typing import BinaryIO, Iterable
 
-from .base import AdapterError, DatabaseAdapter
+from .base import (
+    AdapterError,
+    CommandOutputStream,
+    DatabaseAdapter,
+    parse_connection_uri,
+    run_command,
+    run_with_stream,
+)
+from .compression import detect_codec, open_decompressed_codec
+from .pipeline import advise_dontneed, advise_sequential
+
+MYSQL_URI_SCHEMES = frozenset({"mysql", "mariadb"})
 
 
 class MySQLAdapter(DatabaseAdapter):
@@ -41,11 +50,24 @@ class MySQLAdapter(DatabaseAdapter):
         self.effective_backup_type(backup_type)
 
         self._require_binary("mysqldump")
-        database = self._required_database()
 
         output = Path(output_path)
         output.parent.mkdir(parents=True, exist_ok=True)
 
+        # mysqldump streams to stdout; the file is opened here so its descriptor stays under our control.
+        self._run_command(self._dump_command(tables), "MySQL backup", stdout_path=output)
+        return str(output)
+
+    def supports_stream_backup(self, backup_type: str = "full", tables: Iterable[str] | None = None) -> bool:
+        return True
+
+    def backup_stream(self, backup_type: str = "full", tables: Iterable[str] | None = None) -> BinaryIO:
+        self.effective_backup_type(backup_type)
+        self._require_binary("mysqldump")
+        return CommandOutputStream(self._dump_command(tables), "MySQL backup", env=self._command_env())
+
+    def _dump_command(self, tables: Iterable[str] | None) -> list[str]:
+        database = self._required_database()
         command = [
             "mysqldump",
             "--single-transaction",
@@ -54,15 +76,11 @@ class MySQLAdapter(DatabaseAdapter):
             "--events",
             "--triggers",
             "--no-tablespaces",
-            "--result-file",
-            str(output),
         ]
         command.extend(self._connection_args(include_database=False))
         command.append(database)
         command.extend(self._table_list(tables))
-
-        self._run_command(command, "MySQL backup")
-        return str(output)
+        return command
 
     def restore(self, backup_file: str, tables: Iterable[str] | None = None) -> None:
         if tables:
@@ -77,28 +95,50 @@ class MySQLAdapter(DatabaseAdapter):
 
         command = ["mysql"]
         command.extend(self._connection_args(include_database=True))
-        self._run_command(command, "MySQL restore", stdin_path=source)
+        codec = detect_codec(str(source))
+        if codec is None:
+            self._run_command(command, "MySQL restore", stdin_path=source)
+            return
+        # Compressed dump: inflate on the way into mysql instead of writing a plain copy first.
+        with open_decompressed_codec(str(source), codec) as stream:
+            self._run_command(command, "MySQL restore", stdin_stream=stream)
+
+    def supports_stream_restore(self, backup_name: str, tables: Iterable[str] | None = None) -> bool:
+        return not tables
+
+    def restore_stream(self, stream: BinaryIO, backup_name: str, tables: Iterable[str] | None = None) -> None:
+        if tables:
+            raise AdapterError("Selective restore is not implemented for MySQL yet.")
+
+        self._require_binary("mysql")
+        self._required_database()
+
+        command = ["mysql"]
+        command.extend(self._connection_args(include_database=True))
+        self._run_command(command, "MySQL restore", stdin_stream=stream)
 
-    def _run_command(self, command: list[str], action: str, stdin_path: Path | None = None) -> None:
+    def _run_command(
+        self,
+        command: list[str],
+        action: str,
+        stdin_path: Path | None = None,
+        stdin_stream: BinaryIO | None = None,
+        stdout_path: Path | None = None,
+    ) -> None:
         try:
-            if stdin_path is None:
-                result = subprocess.run(
-                    command,
-                    capture_output=True,
-                    text=True,
-                    env=self._command_env(),
-                    check=False,
-                )
+            if stdin_stream is not None:
+                result = run_with_stream(command, stdin_stream, env=self._command_env())
+            elif stdout_path is not None:
+                with stdout_path.open("wb") as output_handle:
+                    result = run_command(command, env=self._command_env(), stdout=output_handle)
+            elif stdin_path is None:
+                result = run_command(command, env=self._command_env())
             else:
                 with stdin_path.open("rb") as source_handle:
-                    result = subprocess.run(
-                        command,
-                        stdin=source_handle,
-                        capture_output=True,
-                        text=True,
-                        env=self._command_env(),
-                        check=False,
-                    )
+                    advise_sequential(source_handle)
+                    result = run_command(command, env=self._command_env(), stdin=source_handle)
+                    # The dump has been consumed; keep it from crowding hotter data out of the page cache.
+                    advise_dontneed(source_handle)
         except OSError as exc:
             raise AdapterError(f"{action} failed: {exc}") from exc
 
@@ -108,12 +148,12 @@ class MySQLAdapter(DatabaseAdapter):
                 details = "Unknown command failure."
             raise AdapterError(f"{action} failed: {details}")
 
-    def _command_env(self) -> dict[str, str]:
-        env = os.environ.copy()
+    def _command_env(self) -> dict[str, str] | None:
+        # None lets the child inherit this process's environment without copying it.
         password = self.params.get("password")
-        if password:
-            env["MYSQL_PWD"] = str(password)
-        return env
+        if not password:
+            return None
+        return {**os.environ, "MYSQL_PWD": str(password)}
 
     def _require_binary(self, binary_name: str) -> None:
         if shutil.which(binary_name):
@@ -159,19 +199,11 @@ class MySQLAdapter(DatabaseAdapter):
         if not uri:
             return params
 
-        parsed = urlparse(str(uri))
-        if parsed.scheme not in ("mysql", "mariadb"):
+        # Parsed once per distinct URI; explicit params win over values embedded in it.
+        parsed = parse_connection_uri(str(uri), MYSQL_URI_SCHEMES)
+        if parsed is None:
             raise AdapterError("MySQL URI must start with mysql:// or mariadb://")
-
-        if "username" not in params and parsed.username:
-            params["username"] = unquote(parsed.username)
-        if "password" not in params and parsed.password:
-            params["password"] = unquote(parsed.password)
-        if "host" not in params and parsed.hostname:
-            params["host"] = parsed.hostname
-        if "port" not in params and parsed.port:
-            params["port"] = parsed.port
-        if "database" not in params and parsed.path and parsed.path != "/":
-            params["database"] = unquote(parsed.path.lstrip("/"))
+        for key, value in parsed:
+            params.setdefault(key, value)
 
         return params
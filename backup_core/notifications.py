@@ -1,24 +1,88 @@
 from __future__ import annotations
 
+import atexit
 import json
-import urllib.error
-import urllib.request
+import queue
+import threading
+import time
+
+import urllib3
+
+try:
+    # orjson serializes straight to UTF-8 bytes in C, skipping the str round trip.
+    from orjson import dumps as _json_bytes
+except ImportError:
+
+    def _json_bytes(payload: dict) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+NOTIFICATION_QUEUE_SIZE = 100
+NOTIFICATION_TIMEOUT_SECONDS = 5
+NOTIFICATION_DRAIN_SECONDS = 5
+NOTIFICATION_POOL_SIZE = 4
+
+# Keeps the TLS connection to the webhook host alive between notifications.
+_pool = urllib3.PoolManager(maxsize=NOTIFICATION_POOL_SIZE, retries=urllib3.Retry(total=2, backoff_factor=0.1))
+
+_queue: queue.Queue = queue.Queue(maxsize=NOTIFICATION_QUEUE_SIZE)
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
 
 
 def send_slack_notification(webhook_url: str | None, message: str, timeout: int = 10) -> bool:
     if not webhook_url:
         return False
 
-    payload = json.dumps({"text": message}).encode("utf-8")
-    request = urllib.request.Request(
-        webhook_url,
-        data=payload,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
+    payload = _json_bytes({"text": message})
 
     try:
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            return 200 <= response.status < 300
-    except urllib.error.URLError:
+        response = _pool.request(
+            "POST",
+            webhook_url,
+            body=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+        )
+    except urllib3.exceptions.HTTPError:
+        return False
+    return 200 <= response.status < 300
+
+
+def enqueue_slack_notification(webhook_url: str | None, message: str) -> bool:
+    """Queue a Slack message for a background sender; returns False if it was not queued."""
+    if not webhook_url:
         return False
+
+    _ensure_worker()
+    try:
+        _queue.put_nowait((webhook_url, message))
+    except queue.Full:
+        return False
+    return True
+
+
+def _ensure_worker() -> None:
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_drain, name="slack-notifications", daemon=True)
+            _worker.start()
+
+
+def _drain() -> None:
+    while True:
+        webhook_url, message = _queue.get()
+        try:
+            send_slack_notification(webhook_url, message, timeout=NOTIFICATION_TIMEOUT_SECONDS)
+        except Exception:
+            pass  # A notification must never take the sender down.
+        finally:
+            _queue.task_done()
+
+
+@atexit.register
+def _flush_notifications() -> None:
+    # Give queued messages a bounded chance to go out before the interpreter exits.
+    deadline = time.monotonic() + NOTIFICATION_DRAIN_SECONDS
+    while _queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
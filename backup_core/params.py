@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+REDACTED_VALUE = "***"
+REDACTED_PARAM_KEYS = frozenset({"password", "uri", "token", "secret", "azure_connection_string"})
+
+# Command option name -> stored connection param name.
+CONNECTION_OPTION_KEYS = {
+    "db_path": "path",
+    "host": "host",
+    "port": "port",
+    "username": "username",
+    "password": "password",
+    "database": "database",
+    "uri": "uri",
+}
+
+
+def build_connection_params(options: dict) -> dict:
+    """Adapter connection params from the db options shared by the backup/restore commands."""
+    return {
+        param: value
+        for option, param in CONNECTION_OPTION_KEYS.items()
+        if (value := options.get(option)) not in (None, "")
+    }
+
+
+def connection_options(params: dict) -> dict:
+    """Inverse of ``build_connection_params``: command options from stored connection params."""
+    return {
+        option: value
+        for option, param in CONNECTION_OPTION_KEYS.items()
+        if (value := params.get(param)) not in (None, "")
+    }
+
+
+def redact(params: dict) -> dict:
+    result = dict(params)
+    for key in REDACTED_PARAM_KEYS & result.keys():
+        if result[key]:
+            result[key] = REDACTED_VALUE
+    return result
+
+
+def redacted_keys(params: dict) -> list[str]:
+    """Sorted keys whose stored value is the redaction placeholder."""
+    return sorted(key for key in REDACTED_PARAM_KEYS & params.keys() if str(params[key]).strip() == REDACTED_VALUE)
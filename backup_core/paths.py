@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve(path: str) -> Path:
+    return Path(path).resolve()
+
+
+def resolve_setting_path(path: str | os.PathLike) -> Path:
+    """``Path(path).resolve()`` memoised for settings-derived paths, which do not change at runtime."""
+    return _resolve(os.fspath(path))
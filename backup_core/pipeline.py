@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import abc
+import hashlib
+import io
+import os
+import queue
+import threading
+from typing import BinaryIO, Callable
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_PREFETCH_DEPTH = 4
+
+
+def advise_sequential(fileobj: BinaryIO) -> None:
+    """Ask the kernel for aggressive read-ahead on a file that is read once, front to back."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fileobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+
+
+def advise_dontneed(fileobj: BinaryIO) -> None:
+    """Let the kernel drop cached pages of a file nothing will read again soon."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fileobj.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+
+
+class ChunkReader(io.RawIOBase, abc.ABC):
+    """Serves whole chunks from ``_next_chunk`` without copying them when the caller reads enough."""
+
+    def __new__(cls, *args, **kwargs):
+        # io's C base class bypasses ABCMeta's instantiation check, so repeat it here.
+        if cls.__abstractmethods__:
+            missing = ", ".join(sorted(cls.__abstractmethods__))
+            raise TypeError(f"Can't instantiate abstract class {cls.__name__} with abstract methods {missing}")
+        return super().__new__(cls)
+
+    def __init__(self) -> None:
+        self._pending = b""
+        self._offset = 0
+
+    def readable(self) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def _next_chunk(self) -> bytes | None:
+        """Return the next chunk (possibly empty), or None once the stream is exhausted."""
+
+    def _fill(self) -> bool:
+        while self._offset >= len(self._pending):
+            chunk = self._next_chunk()
+            if chunk is None:
+                return False
+            self._pending = chunk
+            self._offset = 0
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            return self.readall()
+        if not size or not self._fill():
+            return b""
+        if self._offset == 0 and len(self._pending) <= size:
+            chunk, self._pending = self._pending, b""
+            return chunk
+        end = self._offset + size
+        chunk = self._pending[self._offset : end]
+        self._offset = end
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        if not self._fill():
+            return 0
+        view = memoryview(self._pending)[self._offset : self._offset + len(buffer)]
+        size = len(view)
+        buffer[:size] = view
+        self._offset += size
+        return size
+
+
+class ChainedReader(ChunkReader):
+    """Read-only stream that lazily pulls chunks from ``source`` through ``transform``."""
+
+    def __init__(
+        self,
+        source: BinaryIO,
+        transform: Callable[[bytes], bytes],
+        finalize: Callable[[], bytes] | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        super().__init__()
+        self._source = source
+        self._transform = transform
+        self._finalize = finalize
+        self._chunk_size = chunk_size
+        self._exhausted = False
+
+    def _next_chunk(self) -> bytes | None:
+        if self._exhausted:
+            return None
+        chunk = self._source.read(self._chunk_size)
+        if chunk:
+            return self._transform(chunk)
+        self._exhausted = True
+        return self._finalize() if self._finalize else b""
+
+
+class HashingReader(io.RawIOBase):
+    """Pass-through reader that hashes and counts every byte handed to the consumer."""
+
+    def __init__(self, source: BinaryIO, algorithm: str = "sha256") -> None:
+        self._source = source
+        self._hasher = hashlib.new(algorithm)
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        if data:
+            self._hasher.update(data)
+            self.bytes_read += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        size = self._source.readinto(buffer) or 0
+        if size:
+            self._hasher.update(memoryview(buffer)[:size])
+            self.bytes_read += size
+        return size
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+class PrefetchReader(ChunkReader):
+    """Reads ``source`` on a worker thread so its CPU work overlaps with the consumer's I/O."""
+
+    _EOF = object()
+
+    def __init__(
+        self,
+        source: BinaryIO,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        depth: int = DEFAULT_PREFETCH_DEPTH,
+    ) -> None:
+        super().__init__()
+        self._source = source
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max(depth, 1))
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._exhausted = False
+
+    def _next_chunk(self) -> bytes | None:
+        if self._exhausted:
+            return None
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._produce, name="backup-prefetch", daemon=True)
+            self._thread.start()
+
+        item = self._queue.get()
+        if isinstance(item, BaseException):
+            self._exhausted = True
+            raise item
+        if item is self._EOF:
+            self._exhausted = True
+            return None
+        return item
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            while self._thread.is_alive():
+                try:
+                    self._queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            self._thread = None
+        super().close()
+
+    def _produce(self) -> None:
+        try:
+            while not self._stop.is_set():
+                chunk = self._source.read(self._chunk_size)
+                self._put(chunk or self._EOF)
+                if not chunk:
+                    return
+        except BaseException as exc:
+            self._put(exc)
+
+    def _put(self, item) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
@@ -1,6 +1,44 @@
 from __future__ import annotations
 
+import functools
+import math
 from pathlib import Path
+from typing import BinaryIO
+
+from .cpu import effective_cpu_count
+
+S3_MAX_POOL_CONNECTIONS = 32
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_MULTIPART_CHUNK_SIZE = 16 * 1024 * 1024
+S3_MAX_CONCURRENCY = 16
+# S3 multipart uploads allow at most 10,000 parts.
+S3_MAX_PARTS = 10_000
+
+
+@functools.lru_cache(maxsize=8)
+def _s3_client(region: str | None):
+    try:
+        import boto3
+        from botocore.config import Config
+    except ImportError as exc:
+        raise RuntimeError("S3 upload requires boto3. Install it with: pip install boto3") from exc
+
+    # Clients are thread-safe; sharing one keeps TLS connections warm between backups.
+    config = Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS, retries={"mode": "adaptive"})
+    return boto3.client("s3", region_name=region, config=config)
+
+
+def _transfer_config(size: int | None = None):
+    from boto3.s3.transfer import TransferConfig
+
+    # Parts upload on several threads; grow the part size for files that would exceed the part limit.
+    chunk_size = max(S3_MULTIPART_CHUNK_SIZE, math.ceil((size or 0) / S3_MAX_PARTS))
+    return TransferConfig(
+        multipart_threshold=S3_MULTIPART_THRESHOLD,
+        multipart_chunksize=chunk_size,
+        max_concurrency=min(S3_MAX_CONCURRENCY, effective_cpu_count() * 2),
+        use_threads=True,
+    )
 
 
 class S3StorageBackend:
@@ -10,18 +48,23 @@ class S3StorageBackend:
         self.region = region
 
     def store_file(self, source_path: str, filename: str | None = None) -> str:
-        try:
-            import boto3
-        except ImportError as exc:
-            raise RuntimeError("S3 upload requires boto3. Install it with: pip install boto3") from exc
-
         source = Path(source_path)
         if not source.exists():
             raise FileNotFoundError(f"Backup file does not exist: {source}")
 
-        object_name = filename or source.name
-        key = f"{self.prefix}/{object_name}" if self.prefix else object_name
+        key = self._key(filename or source.name)
+        client = self._client()
+        client.upload_file(str(source), self.bucket, key, Config=_transfer_config(source.stat().st_size))
+        return f"s3://{self.bucket}/{key}"
 
-        client = boto3.client("s3", region_name=self.region)
-        client.upload_file(str(source), self.bucket, key)
+    def store_stream(self, stream: BinaryIO, filename: str) -> str:
+        key = self._key(filename)
+        client = self._client()
+        client.upload_fileobj(stream, self.bucket, key, Config=_transfer_config())
         return f"s3://{self.bucket}/{key}"
+
+    def _key(self, object_name: str) -> str:
+        return f"{self.prefix}/{object_name}" if self.prefix else object_name
+
+    def _client(self):
+        return _s3_client(self.region)
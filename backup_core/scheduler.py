@@ -1,46 +1,175 @@
 from __future__ import annotations
 
-from django.db import transaction
-from django.db.models import Q
+import calendar
+import functools
+import itertools
+
+from django.db import connections, router, transaction
+from django.db.models import F, Min, Q
 from django.utils import timezone
 
 from .models import Schedule
 
 
+# Run-history columns of the template BackupJob; a scheduler pass only reads its configuration.
+TEMPLATE_JOB_DEFERRED_FIELDS = tuple(
+    f"backup_job__{name}"
+    for name in ("status", "started_at", "finished_at", "duration_seconds", "last_error", "created_at", "updated_at")
+)
+
+
+def _schedules_with_template():
+    return Schedule.objects.select_related("backup_job").defer(*TEMPLATE_JOB_DEFERRED_FIELDS)
+
+
+def due_schedule_filter(now) -> Q:
+    return (
+        Q(is_active=True)
+        & (Q(next_run_at__isnull=True) | Q(next_run_at__lte=now))
+        & (Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now))
+    )
+
+
 def get_due_schedules(now=None):
+    """Due schedules with their template job, oldest-due first (never-run schedules lead)."""
     now = now or timezone.now()
     return (
-        Schedule.objects.filter(is_active=True)
-        .filter(Q(next_run_at__isnull=True) | Q(next_run_at__lte=now))
-        .filter(Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now))
+        _schedules_with_template()
+        .filter(due_schedule_filter(now))
+        .order_by(F("next_run_at").asc(nulls_first=True), "id")
     )
 
 
+def seconds_until_next_run(now=None, schedule_id: int | None = None) -> float | None:
+    """Seconds until the earliest upcoming active schedule, or None when nothing is scheduled."""
+    now = now or timezone.now()
+    queryset = Schedule.objects.filter(is_active=True, next_run_at__gt=now)
+    if schedule_id:
+        queryset = queryset.filter(id=schedule_id)
+    next_run_at = queryset.aggregate(next_run_at=Min("next_run_at"))["next_run_at"]
+    if next_run_at is None:
+        return None
+    return (next_run_at - now).total_seconds()
+
+
 def claim_schedule(schedule_id: int, lease_seconds: int = 300, now=None) -> Schedule | None:
     now = now or timezone.now()
     lease_until = now + timezone.timedelta(seconds=max(int(lease_seconds), 1))
 
-    with transaction.atomic():
-        updated = (
-            Schedule.objects.filter(id=schedule_id, is_active=True)
-            .filter(Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now))
-            .update(lease_expires_at=lease_until)
-        )
-        if updated == 0:
+    claimable = Schedule.objects.filter(id=schedule_id, is_active=True).filter(
+        Q(lease_expires_at__isnull=True) | Q(lease_expires_at__lte=now)
+    )
+
+    database = router.db_for_write(Schedule)
+    if not connections[database].features.has_select_for_update_skip_locked:
+        with transaction.atomic(using=database):
+            if claimable.update(lease_expires_at=lease_until) == 0:
+                return None
+            return _schedules_with_template().get(id=schedule_id)
+
+    # A row another scheduler is claiming counts as taken instead of queueing behind its lock.
+    with transaction.atomic(using=database):
+        locked_id = claimable.select_for_update(skip_locked=True).values_list("id", flat=True).first()
+        if locked_id is None:
             return None
-        return Schedule.objects.select_related("backup_job").get(id=schedule_id)
+        Schedule.objects.filter(id=locked_id).update(lease_expires_at=lease_until)
+    return _schedules_with_template().get(id=locked_id)
+
+
+def claim_due_schedules(
+    max_jobs: int,
+    lease_seconds: int = 300,
+    now=None,
+    schedule_id: int | None = None,
+) -> list[Schedule]:
+    now = now or timezone.now()
+    lease_until = now + timezone.timedelta(seconds=max(int(lease_seconds), 1))
+
+    due = get_due_schedules(now)
+    if schedule_id is not None:
+        due = due.filter(id=schedule_id)
+
+    database = router.db_for_write(Schedule)
+    if not connections[database].features.has_select_for_update_skip_locked:
+        # SQLite: no row locks, so claim each schedule with a conditional update instead.
+        # Ids stream in max_jobs-sized batches and lost races do not shrink the pass.
+        claimed = (
+            claim_schedule(due_id, lease_seconds=lease_seconds, now=now)
+            for due_id in due.values_list("id", flat=True).iterator(chunk_size=max_jobs)
+        )
+        return list(itertools.islice(filter(None, claimed), max_jobs))
+
+    # Rows another scheduler is claiming are skipped instead of waited on.
+    locked_due = due.select_for_update(skip_locked=True).values_list("id", flat=True)[:max_jobs]
+    with transaction.atomic(using=database):
+        if _supports_update_returning(connections[database]):
+            ids = _lease_returning_ids(locked_due, lease_until, database)
+        else:
+            ids = list(locked_due)
+            if ids:
+                Schedule.objects.filter(id__in=ids).update(lease_expires_at=lease_until)
+        if not ids:
+            return []
+
+    # next_run_at is untouched by the lease, so this keeps the oldest-due-first order of the pass.
+    return list(_schedules_with_template().filter(id__in=ids).order_by(*due.query.order_by))
 
 
-def mark_schedule_ran(schedule: Schedule, next_run_at=None):
+def renew_schedule_lease(schedule: Schedule, lease_seconds: int = 300, now=None) -> bool:
+    """Push ``schedule``'s lease forward; False when another scheduler has re-claimed it meanwhile."""
+    now = now or timezone.now()
+    lease_until = now + timezone.timedelta(seconds=max(int(lease_seconds), 1))
+    renewed = Schedule.objects.filter(id=schedule.id, lease_expires_at=schedule.lease_expires_at).update(
+        lease_expires_at=lease_until
+    )
+    if renewed:
+        schedule.lease_expires_at = lease_until
+    return bool(renewed)
+
+
+def _supports_update_returning(connection) -> bool:
+    return connection.vendor == "postgresql"
+
+
+def _lease_returning_ids(locked_due, lease_until, database: str) -> list[int]:
+    """Lock, lease and return the due ids in one UPDATE ... RETURNING round trip."""
+    connection = connections[database]
+    subquery_sql, params = locked_due.query.get_compiler(using=database).as_sql()
+    quote = connection.ops.quote_name
+    opts = Schedule._meta
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {quote(opts.db_table)} SET {quote(opts.get_field('lease_expires_at').column)} = %s "
+            f"WHERE {quote(opts.pk.column)} IN ({subquery_sql}) RETURNING {quote(opts.pk.column)}",
+            [connection.ops.adapt_datetimefield_value(lease_until), *params],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+# Fields each scheduler outcome writes, so a run never overwrites concurrent edits to the rest of the row.
+SCHEDULE_RAN_FIELDS = ["last_run_at", "next_run_at", "retry_count", "last_error", "lease_expires_at"]
+SCHEDULE_FAILED_FIELDS = ["retry_count", "next_run_at", "last_error", "lease_expires_at"]
+SCHEDULE_DISABLED_FIELDS = ["is_active", "last_error", "lease_expires_at"]
+SCHEDULE_LEASE_FIELDS = ["lease_expires_at"]
+
+
+def mark_schedule_ran(schedule: Schedule, next_run_at=None, save: bool = True):
     schedule.last_run_at = timezone.now()
     schedule.next_run_at = next_run_at
     schedule.retry_count = 0
     schedule.last_error = ""
     schedule.lease_expires_at = None
-    schedule.save(update_fields=["last_run_at", "next_run_at", "retry_count", "last_error", "lease_expires_at"])
+    if save:
+        schedule.save(update_fields=SCHEDULE_RAN_FIELDS)
 
 
-def mark_schedule_failed(schedule: Schedule, error_message: str, next_run_at=None, now=None) -> dict:
+def mark_schedule_failed(
+    schedule: Schedule,
+    error_message: str,
+    next_run_at=None,
+    now=None,
+    save: bool = True,
+) -> dict:
     now = now or timezone.now()
     attempt = schedule.retry_count + 1
     max_retries = max(int(schedule.max_retries), 0)
@@ -60,7 +189,8 @@ def mark_schedule_failed(schedule: Schedule, error_message: str, next_run_at=Non
 
     schedule.last_error = (error_message or "").strip()[:4000]
     schedule.lease_expires_at = None
-    schedule.save(update_fields=["retry_count", "next_run_at", "last_error", "lease_expires_at"])
+    if save:
+        schedule.save(update_fields=SCHEDULE_FAILED_FIELDS)
 
     return {
         "state": state,
@@ -78,36 +208,82 @@ def _retry_delay_seconds(base_seconds: int, attempt: int) -> int:
     return min(base * (2**exponent), 3600)
 
 
+CRON_SEARCH_YEARS = 8
+ONE_MINUTE = timezone.timedelta(minutes=1)
+
+
 def get_next_run_at(cron_expression: str, after=None):
     """Compute next run for a 5-field cron expression (minute hour dom month dow)."""
-    minute_set, hour_set, dom_set, month_set, dow_set, dom_any, dow_any = _parse_cron_expression(cron_expression)
     after = after or timezone.now()
+    # The answer only depends on the minute, so every caller within one scheduler pass shares it.
+    return _next_run_after_minute(cron_expression, after.replace(second=0, microsecond=0), after.tzinfo)
+
+
+@functools.lru_cache(maxsize=1024)
+def _next_run_after_minute(cron_expression: str, minute_start, tzinfo):
+    # tzinfo only keys the cache: equal instants in different zones match different wall-clock fields.
+    minutes, hours, days, months, weekdays, dom_any, dow_any = _parse_cron_expression(cron_expression)
 
-    cursor = after.replace(second=0, microsecond=0) + timezone.timedelta(minutes=1)
-    max_minutes = 60 * 24 * 366  # one year search window
+    start = minute_start + ONE_MINUTE
+    # Field jumps make each pass cheap, so the window can span a full leap-year cycle (Feb 29 across 2100 is 8 years).
+    deadline = (start.year + CRON_SEARCH_YEARS, start.month, start.day, start.hour, start.minute)
 
-    for _ in range(max_minutes):
-        cron_dow = (cursor.weekday() + 1) % 7  # cron: Sunday=0
-        if cursor.month not in month_set:
-            cursor += timezone.timedelta(minutes=1)
+    # Jump field by field (month, day, hour, minute) on plain ints; a datetime is only built for the answer.
+    year, month, day, hour, minute = start.year, start.month, start.day, start.hour, start.minute
+    while (year, month, day, hour, minute) < deadline:
+        next_month = _next_allowed(months, month)
+        if next_month is None:
+            year, month, day, hour, minute = year + 1, _next_allowed(months, 1), 1, 0, 0
             continue
-        if cursor.hour not in hour_set:
-            cursor += timezone.timedelta(minutes=1)
+        if next_month != month:
+            month, day, hour, minute = next_month, 1, 0, 0
+        next_day = _next_allowed(_month_day_mask(year, month, days, weekdays, dom_any, dow_any), day)
+        if next_day is None:
+            # Month 13 has no allowed bits, so the next pass carries into the following year.
+            month, day, hour, minute = month + 1, 1, 0, 0
             continue
-        if cursor.minute not in minute_set:
-            cursor += timezone.timedelta(minutes=1)
+        if next_day != day:
+            day, hour, minute = next_day, 0, 0
+        next_hour = _next_allowed(hours, hour)
+        if next_hour is None:
+            # Days past the month's end have no bits in its day mask, so this carries into the next month.
+            day, hour, minute = day + 1, 0, 0
             continue
-        if not _day_matches(cursor.day, cron_dow, dom_set, dow_set, dom_any, dow_any):
-            cursor += timezone.timedelta(minutes=1)
+        if next_hour != hour:
+            hour, minute = next_hour, 0
+        next_minute = _next_allowed(minutes, minute)
+        if next_minute is None:
+            # Hour 24 has no allowed bits, so the next pass carries into the following day.
+            hour, minute = hour + 1, 0
             continue
-        return cursor
+        return start.replace(year=year, month=month, day=day, hour=hour, minute=next_minute)
 
     raise ValueError(f"Could not compute next run for cron expression: {cron_expression}")
 
 
-def _day_matches(day, cron_dow, dom_set, dow_set, dom_any, dow_any):
-    dom_match = day in dom_set
-    dow_match = cron_dow in dow_set
+def _next_allowed(mask: int, current: int) -> int | None:
+    """Lowest set bit of ``mask`` at or above ``current``, or None to carry into the next unit."""
+    remaining = mask >> current
+    if not remaining:
+        return None
+    return current + (remaining & -remaining).bit_length() - 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _month_day_mask(year: int, month: int, days: int, weekdays: int, dom_any: bool, dow_any: bool) -> int:
+    """Bitmask of the days of ``month`` that satisfy both day fields, folded once per month and expression."""
+    first_weekday, length = calendar.monthrange(year, month)
+    mask = 0
+    for day in range(1, length + 1):
+        cron_dow = (first_weekday + day) % 7  # calendar: Monday=0; cron: Sunday=0
+        if _day_matches(day, cron_dow, days, weekdays, dom_any, dow_any):
+            mask |= 1 << day
+    return mask
+
+
+def _day_matches(day, cron_dow, days, weekdays, dom_any, dow_any):
+    dom_match = (days >> day) & 1
+    dow_match = (weekdays >> cron_dow) & 1
 
     if dom_any and dow_any:
         return True
@@ -118,34 +294,40 @@ def _day_matches(day, cron_dow, dom_set, dow_set, dom_any, dow_any):
     return dom_match or dow_match
 
 
-def _parse_cron_expression(expression: str):
-    aliases = {
-        "@yearly": "0 0 1 1 *",
-        "@annually": "0 0 1 1 *",
-        "@monthly": "0 0 1 * *",
-        "@weekly": "0 0 * * 0",
-        "@daily": "0 0 * * *",
-        "@midnight": "0 0 * * *",
-        "@hourly": "0 * * * *",
-    }
+CRON_ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
 
+
+def _parse_cron_expression(expression: str):
     expression = (expression or "").strip()
-    expression = aliases.get(expression, expression)
+    # Aliases and their expansions share one cache entry.
+    return _parse_normalized_cron(CRON_ALIASES.get(expression, expression))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_normalized_cron(expression: str):
     parts = expression.split()
     if len(parts) != 5:
         raise ValueError("Cron expression must contain 5 fields.")
 
-    minute_any, minute_set = _parse_cron_field(parts[0], 0, 59, "minute")
-    hour_any, hour_set = _parse_cron_field(parts[1], 0, 23, "hour")
-    dom_any, dom_set = _parse_cron_field(parts[2], 1, 31, "day_of_month")
-    month_any, month_set = _parse_cron_field(parts[3], 1, 12, "month")
-    dow_any, dow_set = _parse_cron_field(parts[4], 0, 7, "day_of_week")
+    _, minute_mask = _parse_cron_field(parts[0], 0, 59, "minute")
+    _, hour_mask = _parse_cron_field(parts[1], 0, 23, "hour")
+    dom_any, dom_mask = _parse_cron_field(parts[2], 1, 31, "day_of_month")
+    _, month_mask = _parse_cron_field(parts[3], 1, 12, "month")
+    dow_any, dow_mask = _parse_cron_field(parts[4], 0, 7, "day_of_week")
 
-    if 7 in dow_set:
-        dow_set.remove(7)
-        dow_set.add(0)
+    if dow_mask & (1 << 7):
+        dow_mask = (dow_mask & ~(1 << 7)) | 1  # cron accepts 7 for Sunday
 
-    return minute_set, hour_set, dom_set, month_set, dow_set, dom_any, dow_any
+    # One int bitmask per field (bit v set = value v allowed): immutable for the cache, tested with shifts.
+    return minute_mask, hour_mask, dom_mask, month_mask, dow_mask, dom_any, dow_any
 
 
 def _parse_cron_field(field: str, minimum: int, maximum: int, name: str):
@@ -154,9 +336,9 @@ def _parse_cron_field(field: str, minimum: int, maximum: int, name: str):
         raise ValueError(f"Empty cron field: {name}")
 
     if field == "*":
-        return True, set(range(minimum, maximum + 1))
+        return True, _bit_range(minimum, maximum + 1, 1)
 
-    values = set()
+    values = 0
     for chunk in field.split(","):
         chunk = chunk.strip()
         if not chunk:
@@ -189,14 +371,24 @@ def _parse_cron_field(field: str, minimum: int, maximum: int, name: str):
         if start < minimum or end > maximum:
             raise ValueError(f"Value out of range in cron field {name}: {chunk}")
 
-        for value in range(start, end + 1, step):
-            values.add(value)
+        values |= _bit_range(start, end + 1, step)
 
     if not values:
         raise ValueError(f"No values parsed for cron field: {name}")
     return False, values
 
 
+def _bit_range(start: int, stop: int, step: int) -> int:
+    """Bitmask with bit ``v`` set for every ``v`` in ``range(start, stop, step)``."""
+    if step == 1:
+        # Contiguous ranges ('*', 'a-b', single values) are one subtraction.
+        return (1 << stop) - (1 << start) if stop > start else 0
+    mask = 0
+    for value in range(start, stop, step):
+        mask |= 1 << value
+    return mask
+
+
 def _parse_int(value: str, name: str):
     try:
         return int(value)
@@ -1,18 +1,37 @@
 from __future__ import annotations
 
+import atexit
 import os
 import sqlite3
 import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import closing, contextmanager
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, Iterator
 
 from django.conf import settings
 
 from .base import AdapterError, DatabaseAdapter
 
+# Pages copied per backup step; between steps other connections may take the write lock.
+SQLITE_BACKUP_PAGES = 1024
+
+# The copy target is a scratch file that is discarded on failure, so it can skip journaling and fsyncs.
+# Restore syncs the finished copy once before swapping it in (see _durable_replace).
+DESTINATION_PRAGMAS = ("synchronous=OFF", "journal_mode=OFF", "temp_store=MEMORY", "cache_size=-65536")
+
+READ_ONLY_CONNECTION_CACHE_SIZE = 8
+
+# Health-check connections by path, tagged with the file identity they were opened on.
+_read_only_connections: OrderedDict[str, tuple[tuple[int, int], sqlite3.Connection]] = OrderedDict()
+_read_only_connections_lock = threading.Lock()
+
 
 class SQLiteAdapter(DatabaseAdapter):
     db_type = "sqlite"
+    # Opening a local file is cheaper than tracking whether it still exists.
+    connection_check_ttl = 0
 
     def _database_path(self) -> Path:
         db_path = self.connection_params.get("path")
@@ -31,12 +50,15 @@ class SQLiteAdapter(DatabaseAdapter):
             raise AdapterError(f"SQLite database file does not exist: {db_path}")
 
         try:
+            if str(db_path) != ":memory:" and db_path.exists():
+                _probe_read_only(db_path)
+                return
             if str(db_path) != ":memory:" and allow_create:
                 db_path.parent.mkdir(parents=True, exist_ok=True)
             conn = sqlite3.connect(str(db_path), timeout=10)
             conn.execute("SELECT 1;")
             conn.close()
-        except sqlite3.Error as exc:
+        except (OSError, sqlite3.Error) as exc:
             raise AdapterError(f"Failed to connect to SQLite database: {exc}") from exc
 
     def backup(
@@ -59,11 +81,7 @@ class SQLiteAdapter(DatabaseAdapter):
         output.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            src_conn = sqlite3.connect(str(source_path))
-            dst_conn = sqlite3.connect(str(output))
-            src_conn.backup(dst_conn)
-            dst_conn.close()
-            src_conn.close()
+            _copy_database(source_path, output)
         except sqlite3.Error as exc:
             raise AdapterError(f"SQLite backup failed: {exc}") from exc
 
@@ -80,8 +98,12 @@ class SQLiteAdapter(DatabaseAdapter):
         target_path = self._database_path()
         target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        if backup_path.resolve() == target_path.resolve():
-            return
+        try:
+            # One stat per path, instead of resolve() walking every component of both.
+            if os.path.samefile(backup_path, target_path):
+                return
+        except FileNotFoundError:
+            pass
 
         tmp_fd, tmp_path = tempfile.mkstemp(
             prefix="sqlite_restore_",
@@ -91,13 +113,92 @@ class SQLiteAdapter(DatabaseAdapter):
         os.close(tmp_fd)
 
         try:
-            src_conn = sqlite3.connect(str(backup_path))
-            dst_conn = sqlite3.connect(tmp_path)
-            src_conn.backup(dst_conn)
-            dst_conn.close()
-            src_conn.close()
-            os.replace(tmp_path, target_path)
+            _copy_database(backup_path, Path(tmp_path))
+            _durable_replace(Path(tmp_path), target_path)
         except sqlite3.Error as exc:
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
             raise AdapterError(f"SQLite restore failed: {exc}") from exc
+
+
+def _durable_replace(source: Path, target: Path) -> None:
+    """``os.replace`` that flushes ``source`` first and the rename after, so a crash cannot leave a torn target."""
+    with source.open("r+b") as handle:
+        os.fsync(handle.fileno())
+    os.replace(source, target)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(target.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _probe_read_only(path: Path) -> None:
+    """Run ``SELECT 1`` on a cached read-only connection, reopening it if the file was replaced."""
+    stat = path.stat()
+    identity = (stat.st_dev, stat.st_ino)
+    key = str(path)
+    with _read_only_connections_lock:
+        cached = _read_only_connections.pop(key, None)
+        if cached is not None and cached[0] != identity:
+            # A restore swapped the file in; drop the handle that pins the old one.
+            cached[1].close()
+            cached = None
+        if cached is None:
+            uri = f"{path.resolve().as_uri()}?mode=ro"
+            cached = (identity, sqlite3.connect(uri, uri=True, timeout=10, check_same_thread=False))
+        _read_only_connections[key] = cached
+        while len(_read_only_connections) > READ_ONLY_CONNECTION_CACHE_SIZE:
+            _key, (_identity, evicted) = _read_only_connections.popitem(last=False)
+            evicted.close()
+        cached[1].execute("SELECT 1;")
+
+
+@atexit.register
+def _close_read_only_connections() -> None:
+    with _read_only_connections_lock:
+        while _read_only_connections:
+            _key, (_identity, conn) = _read_only_connections.popitem()
+            conn.close()
+
+
+def _copy_database(source: Path, destination: Path) -> None:
+    """Online-backup ``source`` into ``destination`` in page batches so writers are not stalled for the whole copy."""
+    pages = getattr(settings, "BACKUP_SQLITE_BACKUP_PAGES", SQLITE_BACKUP_PAGES)
+    with closing(sqlite3.connect(str(source))) as src_conn, closing(sqlite3.connect(str(destination))) as dst_conn:
+        for pragma in DESTINATION_PRAGMAS:
+            dst_conn.execute(f"PRAGMA {pragma}")
+        page_size = src_conn.execute("PRAGMA page_size").fetchone()[0]
+        with _source_readahead(source, page_size, pages) as progress:
+            src_conn.backup(dst_conn, pages=pages, progress=progress, sleep=0.001)
+
+
+@contextmanager
+def _source_readahead(source: Path, page_size: int, pages: int) -> Iterator[Callable[[int, int, int], None] | None]:
+    """Backup progress callback that has the kernel read the batch after next while the current one is copied."""
+    batch_bytes = page_size * pages
+    if batch_bytes <= 0 or not hasattr(os, "posix_fadvise"):
+        yield None
+        return
+    try:
+        fd = os.open(source, os.O_RDONLY)
+    except OSError:
+        yield None
+        return
+
+    def prefetch(offset: int) -> None:
+        try:
+            os.posix_fadvise(fd, offset, batch_bytes, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+
+    def progress(_status: int, remaining: int, total: int) -> None:
+        prefetch((total - remaining) * page_size + batch_bytes)
+
+    try:
+        prefetch(0)
+        prefetch(batch_bytes)
+        yield progress
+    finally:
+        os.close(fd)
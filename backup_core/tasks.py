@@ -1,19 +1,26 @@
 from __future__ import annotations
 
-import io
-
-from django.core.management import call_command
+from django.conf import settings
 
 from celery import shared_task
 
 from backup_core.logger import get_logger
-
-
-@shared_task(bind=True, name="backup_core.tasks.run_scheduler_once")
-def run_scheduler_once(self, max_jobs: int = 20, schedule_id: int | None = None, dry_run: bool = False):
+from backup_core.management.commands.run_scheduler import run_scheduler
+from backup_core.scheduler import seconds_until_next_run
+
+
+# Beat fires this and never reads the result, so don't write one to the result backend every tick.
+@shared_task(bind=True, name="backup_core.tasks.run_scheduler_once", ignore_result=True)
+def run_scheduler_once(
+    self,
+    max_jobs: int = 20,
+    schedule_id: int | None = None,
+    dry_run: bool = False,
+    follow_up: bool = True,
+):
     """
     Execute one scheduler pass inside a Celery worker.
-    This reuses the existing management command logic.
+    This runs the run_scheduler command logic in-process, without call_command dispatch.
     """
     logger = get_logger("backup_core.celery")
     logger.info(
@@ -23,16 +30,23 @@ def run_scheduler_once(self, max_jobs: int = 20, schedule_id: int | None = None,
         dry_run,
     )
 
-    call_command(
-        "run_scheduler",
-        once=True,
-        max_jobs=max_jobs,
-        schedule_id=schedule_id,
-        dry_run=dry_run,
-        quiet=True,
-        stdout=io.StringIO(),
-        stderr=io.StringIO(),
-    )
+    run_scheduler(once=True, max_jobs=max_jobs, schedule_id=schedule_id, dry_run=dry_run, quiet=True)
+
+    if follow_up and not dry_run:
+        _queue_follow_up_pass(self, max_jobs, schedule_id)
 
     logger.info("Celery task finished: run_scheduler_once")
     return {"status": "ok", "max_jobs": max_jobs, "schedule_id": schedule_id, "dry_run": dry_run}
+
+
+def _queue_follow_up_pass(task, max_jobs: int, schedule_id: int | None) -> None:
+    # Beat only fires every BACKUP_SCHEDULER_BEAT_INTERVAL_SECONDS; run once more when a schedule is due before then.
+    remaining = seconds_until_next_run(schedule_id=schedule_id)
+    beat_interval = getattr(settings, "BACKUP_SCHEDULER_BEAT_INTERVAL_SECONDS", 60)
+    if remaining is None or remaining >= beat_interval:
+        return
+    # The follow-up does not chain again, so each beat tick adds at most one extra pass.
+    task.apply_async(
+        kwargs={"max_jobs": max_jobs, "schedule_id": schedule_id, "dry_run": False, "follow_up": False},
+        countdown=max(remaining, 1),
+    )
@@ -40,6 +40,6 @@ if beat_interval > 0:
     }
 
 
-@app.task(bind=True)
+@app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
@@ -7,8 +7,15 @@ from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+_TRUTHY_ENV_VALUES = frozenset({"1", "true", "yes", "on"})
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.environ.get(name, default).strip().lower() in _TRUTHY_ENV_VALUES
+
+
 SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY", "insecure-dev-key-change-me")
-DEBUG = os.environ.get("DJANGO_DEBUG", "1") == "1"
+DEBUG = _env_flag("DJANGO_DEBUG", "1")
 ALLOWED_HOSTS = [host.strip() for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "").split(",") if host.strip()]
 
 INSTALLED_APPS = [
@@ -51,10 +58,10 @@ TEMPLATES = [
 WSGI_APPLICATION = "dbbackup.wsgi.application"
 
 # Metadata/control database used by Django models such as BackupJob, BackupArtifact, RestoreJob.
-SQLITE_DB_PATH = os.environ.get("DJANGO_SQLITE_PATH", str(BASE_DIR / "control.sqlite3"))
+SQLITE_DB_PATH = os.environ.get("DJANGO_SQLITE_PATH", os.path.join(BASE_DIR, "control.sqlite3"))
 
 # Default target SQLite database to backup/restore when --db-path is not provided.
-TARGET_SQLITE_DB_PATH = os.environ.get("TARGET_SQLITE_DB_PATH", str(BASE_DIR / "db.sqlite3"))
+TARGET_SQLITE_DB_PATH = os.environ.get("TARGET_SQLITE_DB_PATH", os.path.join(BASE_DIR, "db.sqlite3"))
 
 DATABASES = {
     "default": {
@@ -88,3 +95,37 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 BACKUP_ROOT = BASE_DIR / "backups"
 BACKUP_LOG_FILE = BASE_DIR / "logs" / "backup.log"
+
+# The test runner points BACKUP_LOG_FILE at a temporary file so test runs leave logs/ alone.
+TEST_RUNNER = "dbbackup.test_runner.BackupTestRunner"
+
+# gzip tuning for backup compression: level 1 favours speed, buffer size is in bytes.
+BACKUP_GZIP_LEVEL = int(os.environ.get("BACKUP_GZIP_LEVEL", "1"))
+BACKUP_GZIP_BUFSIZE = int(os.environ.get("BACKUP_GZIP_BUFSIZE", str(1024 * 1024)))
+
+# Codec for --compress backups: "gzip" (.gz) or "zstd" (.zst, needs the zstandard package).
+BACKUP_COMPRESSION_CODEC = os.environ.get("BACKUP_COMPRESSION_CODEC", "gzip")
+BACKUP_ZSTD_LEVEL = int(os.environ.get("BACKUP_ZSTD_LEVEL", "3"))
+
+# Parallel (rapidgzip) decompression for large archives on restore.
+BACKUP_PARALLEL_GZIP_MIN_BYTES = int(os.environ.get("BACKUP_PARALLEL_GZIP_MIN_BYTES", str(256 * 1024 * 1024)))
+BACKUP_PARALLEL_GZIP_CHUNK_MIB = int(os.environ.get("BACKUP_PARALLEL_GZIP_CHUNK_MIB", "4"))
+
+# Parallel block uploads per Azure blob.
+BACKUP_AZURE_CONCURRENCY = int(os.environ.get("BACKUP_AZURE_CONCURRENCY", "8"))
+
+# mongodump/mongorestore collection workers; 0 picks half the CPU count.
+BACKUP_MONGO_PARALLELISM = int(os.environ.get("BACKUP_MONGO_PARALLELISM", "0"))
+
+# pg_dump --jobs for full PostgreSQL backups (directory format packed as .tar); 0 picks the CPU count
+# capped at 8, 1 keeps single-threaded custom-format dumps.
+BACKUP_PG_JOBS = int(os.environ.get("BACKUP_PG_JOBS", "0"))
+
+# How often Celery Beat queues a scheduler pass; a schedule due sooner gets a one-off follow-up pass.
+BACKUP_SCHEDULER_BEAT_INTERVAL_SECONDS = int(os.environ.get("BACKUP_SCHEDULER_BEAT_INTERVAL_SECONDS", "60"))
+
+# Pages copied per SQLite online-backup step; -1 copies the whole database in one locked step.
+BACKUP_SQLITE_BACKUP_PAGES = int(os.environ.get("BACKUP_SQLITE_BACKUP_PAGES", "1024"))
+
+# Tables restored in parallel for selective restores (1 keeps restores sequential).
+BACKUP_RESTORE_CONCURRENCY = int(os.environ.get("BACKUP_RESTORE_CONCURRENCY", "1"))
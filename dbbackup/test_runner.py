@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+
+class BackupTestRunner(DiscoverRunner):
+    """Test runner that sends backup logs to a scratch directory instead of the project's logs/."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._log_dir = tempfile.TemporaryDirectory(prefix="dbbackup_test_logs_")
+        settings.BACKUP_LOG_FILE = Path(self._log_dir.name) / "backup.log"
+
+    def teardown_test_environment(self, **kwargs):
+        super().teardown_test_environment(**kwargs)
+        self._log_dir.cleanup()